@@ -16,6 +16,7 @@ permissions and limitations under the License.
 """
 import copy
 import importlib
+from functools import lru_cache
 from typing import Any, Callable, Literal, Optional
 
 from verticapy._typing import NoneType
@@ -31,6 +32,7 @@ from verticapy._config.validators import (
 from verticapy.errors import OptionError
 
 
+@lru_cache(maxsize=None)
 def get_import_success(module: str) -> bool:
     """
     Confirms whether a module was
@@ -18,12 +18,30 @@ This file was created to avoid circular import and to
 locate all  the  inner functions imports in only  one
 single file.  No other file should have inner imports.
 """
+from functools import lru_cache
 from typing import Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from verticapy.core.vdataframe.base import vDataColumn, vDataFrame
     import verticapy.machine_learning.vertica as vml
 
+# The inner imports are resolved once and memoized: these
+# functions are called in the hot paths of the vDataFrame.
+
+
+@lru_cache(maxsize=None)
+def _get_vdc_class() -> type:
+    from verticapy.core.vdataframe.base import vDataColumn
+
+    return vDataColumn
+
+
+@lru_cache(maxsize=None)
+def _get_vdf_class() -> type:
+    from verticapy.core.vdataframe.base import vDataFrame
+
+    return vDataFrame
+
 
 def create_new_vdc(*args, **kwargs) -> "vDataColumn":
     """
@@ -37,9 +55,7 @@ def create_new_vdc(*args, **kwargs) -> "vDataColumn":
         the function. For more information about the object,
         please refer to the link above.
     """
-    from verticapy.core.vdataframe.base import vDataColumn
-
-    return vDataColumn(*args, **kwargs)
+    return _get_vdc_class()(*args, **kwargs)
 
 
 def create_new_vdf(*args, **kwargs) -> "vDataFrame":
@@ -54,11 +70,10 @@ def create_new_vdf(*args, **kwargs) -> "vDataFrame":
         the function. For more information about the object,
         please refer to the link above.
     """
-    from verticapy.core.vdataframe.base import vDataFrame
-
-    return vDataFrame(*args, **kwargs)
+    return _get_vdf_class()(*args, **kwargs)
 
 
+@lru_cache(maxsize=None)
 def get_vertica_mllib() -> Literal["vml"]:
     """
     Gets the Vertica machine learning module:
@@ -217,12 +217,16 @@ def save_verticapy_logs(func: Callable) -> Callable:
         usage.
     """
 
+    name = func.__name__
+    module_path = func.__module__.replace("verticapy.", "")
+    var_names = func.__code__.co_varnames
+
     @wraps(func)
     def func_prec_save_logs(*args, **kwargs) -> Any:
-        name = func.__name__
-        path = func.__module__.replace("verticapy.", "")
+        if not conf.get_option("save_query_profile"):
+            return func(*args, **kwargs)
+        path = module_path
         json_dict = {}
-        var_names = func.__code__.co_varnames
         if len(args) == len(var_names):
             for idx, arg in enumerate(args):
                 if var_names[idx] != "self":
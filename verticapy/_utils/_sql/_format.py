@@ -16,6 +16,7 @@ permissions and limitations under the License.
 """
 import re
 import warnings
+from functools import lru_cache
 from typing import Any, Iterable, Literal, Optional
 
 import numpy as np
@@ -1197,29 +1198,26 @@ def format_type(*args, dtype: Literal[NoneType, dict, list], na_out: Any = None)
         construct others, simplifying the overall
         code.
     """
-    res = ()
-    for arg in args:
-        if isinstance(arg, NoneType):
-            if not isinstance(na_out, NoneType):
-                r = na_out
-            elif dtype == list:
-                r = []
-            elif dtype == dict:
-                r = {}
-            else:
-                r = None
-        elif isinstance(arg, (float, int, str)):
-            if dtype == list:
-                r = [arg]
-            else:
-                r = arg
-        else:
-            r = arg
-        res += (r,)
-    if len(res) == 1:
-        return res[0]
-    else:
-        return res
+    if len(args) == 1:
+        return _format_type_arg(args[0], dtype, na_out)
+    return tuple(_format_type_arg(arg, dtype, na_out) for arg in args)
+
+
+def _format_type_arg(arg: Any, dtype: Any, na_out: Any) -> Any:
+    """
+    Formats a single ``format_type`` input.
+    """
+    if arg is None:
+        if na_out is not None:
+            return na_out
+        elif dtype is list:
+            return []
+        elif dtype is dict:
+            return {}
+        return None
+    elif dtype is list and isinstance(arg, (float, int, str)):
+        return [arg]
+    return arg
 
 
 def indent_vpy_sql(query: SQLExpression) -> SQLExpression:
@@ -1345,6 +1343,24 @@ def list_strip(L: list) -> list:
     return [val.strip() for val in L]
 
 
+@lru_cache(maxsize=4096)
+def _quote_ident_str(column: str, lower: bool = False) -> str:
+    """
+    Memoized ``str`` path of
+    ``quote_ident``.
+    """
+    tmp_column = column
+    if len(tmp_column) >= 2 and (tmp_column[0] == tmp_column[-1] == '"'):
+        tmp_column = tmp_column[1:-1]
+    temp_column_str = tmp_column.replace('"', '""')
+    temp_column_str = f'"{temp_column_str}"'
+    if temp_column_str == '""':
+        return ""
+    elif lower:
+        temp_column_str = temp_column_str.lower()
+    return temp_column_str
+
+
 def quote_ident(column: Optional[SQLColumns], lower: bool = False) -> SQLColumns:
     """
     Returns the specified string argument in the format
@@ -1387,16 +1403,7 @@ def quote_ident(column: Optional[SQLColumns], lower: bool = False) -> SQLColumns
         code.
     """
     if isinstance(column, str):
-        tmp_column = str(column)
-        if len(tmp_column) >= 2 and (tmp_column[0] == tmp_column[-1] == '"'):
-            tmp_column = tmp_column[1:-1]
-        temp_column_str = str(tmp_column).replace('"', '""')
-        temp_column_str = f'"{temp_column_str}"'
-        if temp_column_str == '""':
-            return ""
-        elif lower:
-            temp_column_str = temp_column_str.lower()
-        return temp_column_str
+        return _quote_ident_str(str(column), lower)
     elif isinstance(column, NoneType):
         return ""
     elif isinstance(column, Iterable):
@@ -14,11 +14,125 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
 
 from verticapy._utils._sql._format import format_type, quote_ident
 
 
+@lru_cache(maxsize=128)
+def _build_trie(words: tuple) -> dict:
+    """
+    Builds a character trie from the
+    input words. Each terminal node
+    stores, under the ``""`` key, the
+    lowest index of the words ending
+    there.
+    """
+    trie = {}
+    for i, w in enumerate(words):
+        node = trie
+        for c in w:
+            node = node.setdefault(c, {})
+        node.setdefault("", i)
+    return trie
+
+
+def _match_trie(chars: Iterable[str], trie: dict) -> int:
+    """
+    Walks the trie along the input
+    characters and returns the length
+    of the matching word having the
+    lowest index in the initial ``list``.
+    Returns -1 if no word matches.
+    """
+    best, length = trie.get(""), 0
+    node = trie
+    for n, c in enumerate(chars, 1):
+        node = node.get(c)
+        if node is None:
+            break
+        idx = node.get("")
+        if idx is not None and (best is None or idx < best):
+            best, length = idx, n
+    return -1 if best is None else length
+
+
+@lru_cache(maxsize=128)
+def _compile_word_pattern(words: tuple) -> re.Pattern:
+    """
+    Compiles a single alternation of
+    the input words, longest first.
+    """
+    return re.compile("|".join(map(re.escape, sorted(words, key=len, reverse=True))))
+
+
+@lru_cache(maxsize=128)
+def _single_char_words(words: tuple) -> Optional[frozenset]:
+    """
+    Returns the ``set`` of the input
+    words if they are all single
+    characters, ``None`` otherwise.
+    """
+    if all(isinstance(w, str) and len(w) == 1 for w in words):
+        return frozenset(words)
+    return None
+
+
+def _erase_prefix(name: str, prefix: tuple) -> str:
+    """
+    Core of ``erase_prefix_in_name``
+    working on an already formatted
+    ``tuple`` of prefixes.
+    """
+    if not name.startswith(prefix):
+        return name
+    elif len(prefix) == 1:
+        return name[len(prefix[0]) :]
+    n = _match_trie(name, _build_trie(prefix))
+    if n > 0:
+        return name[n:]
+    return name
+
+
+def _erase_suffix(name: str, suffix: tuple) -> str:
+    """
+    Core of ``erase_suffix_in_name``
+    working on an already formatted
+    ``tuple`` of suffixes.
+    """
+    suffix = tuple(s for s in suffix if s)
+    if not name.endswith(suffix):
+        return name
+    elif len(suffix) == 1:
+        return name[: -len(suffix[0])]
+    n = _match_trie(reversed(name), _build_trie(tuple(s[::-1] for s in suffix)))
+    if n > 0:
+        return name[:-n]
+    return name
+
+
+def _erase_word(name: str, word: tuple) -> str:
+    """
+    Core of ``erase_word_in_name``
+    working on an already formatted
+    ``tuple`` of words.
+    """
+    if not word:
+        return name
+    chars = _single_char_words(word)
+    if chars is not None:
+        if chars.isdisjoint(name):
+            return name
+    elif not _compile_word_pattern(word).search(name):
+        return name
+    for w in word:
+        if w in name:
+            return name.replace(w, "")
+    return name
+
+
 def erase_prefix_in_name(name: str, prefix: Optional[list] = None) -> str:
     """
     Excludes the input ``lists`` of
@@ -64,14 +178,7 @@ def erase_prefix_in_name(name: str, prefix: Optional[list] = None) -> str:
         construct others, simplifying the overall
         code.
     """
-    prefix = format_type(prefix, dtype=list)
-    new_name = name
-    for p in prefix:
-        n = len(p)
-        if p in new_name and new_name[:n] == p:
-            new_name = new_name[n:]
-            break
-    return new_name
+    return _erase_prefix(name, tuple(format_type(prefix, dtype=list)))
 
 
 def erase_suffix_in_name(name: str, suffix: Optional[list] = None) -> str:
@@ -118,14 +225,7 @@ def erase_suffix_in_name(name: str, suffix: Optional[list] = None) -> str:
         construct others, simplifying the overall
         code.
     """
-    suffix = format_type(suffix, dtype=list)
-    new_name = name
-    for s in suffix:
-        n = len(s)
-        if s in new_name and new_name[-n:] == s:
-            new_name = new_name[:-n]
-            break
-    return new_name
+    return _erase_suffix(name, tuple(format_type(suffix, dtype=list)))
 
 
 def erase_word_in_name(name: str, word: Optional[list] = None) -> str:
@@ -172,12 +272,7 @@ def erase_word_in_name(name: str, word: Optional[list] = None) -> str:
         construct others, simplifying the overall
         code.
     """
-    word = format_type(word, dtype=list)
-    for w in word:
-        if w in name:
-            return name.replace(w, "")
-            break
-    return name
+    return _erase_word(name, tuple(format_type(word, dtype=list)))
 
 
 def erase_in_name(
@@ -250,16 +345,21 @@ def erase_in_name(
         construct others, simplifying the overall
         code.
     """
-    order = format_type(order, dtype=list, na_out=["p", "s", "w"])
     suffix, prefix, word = format_type(suffix, prefix, word, dtype=list)
+    if not (prefix or suffix or word):
+        return name
+    order = format_type(order, dtype=list, na_out=["p", "s", "w"])
+    suffix, prefix, word = tuple(suffix), tuple(prefix), tuple(word)
     new_name = name
-    f = {
-        "p": (erase_prefix_in_name, prefix),
-        "s": (erase_suffix_in_name, suffix),
-        "w": (erase_word_in_name, word),
-    }
     for x in order:
-        new_name = f[x][0](new_name, f[x][1])
+        if x == "p":
+            new_name = _erase_prefix(new_name, prefix)
+        elif x == "s":
+            new_name = _erase_suffix(new_name, suffix)
+        elif x == "w":
+            new_name = _erase_word(new_name, word)
+        else:
+            raise KeyError(x)
     return new_name
 
 
@@ -340,6 +440,8 @@ def is_similar_name(
     skip_suffix, skip_prefix, skip_word = format_type(
         skip_suffix, skip_prefix, skip_word, dtype=list
     )
+    if not (skip_suffix or skip_prefix or skip_word):
+        return name1 == name2
     n1 = erase_in_name(
         name=name1,
         suffix=skip_suffix,
@@ -357,6 +459,113 @@ def is_similar_name(
     return n1 == n2
 
 
+@lru_cache(maxsize=128)
+def _precompute_group(
+    group: tuple, suffix: tuple, prefix: tuple, word: tuple, order: tuple
+) -> frozenset:
+    """
+    Cached core of ``precompute_group``.
+    """
+    return frozenset(
+        erase_in_name(name=n, suffix=suffix, prefix=prefix, word=word, order=order)
+        for n in group
+    )
+
+
+def precompute_group(
+    group: list,
+    skip_suffix: Optional[list] = None,
+    skip_prefix: Optional[list] = None,
+    skip_word: Optional[list] = None,
+    order: Optional[list] = None,
+) -> frozenset:
+    """
+    Excludes the input ``lists``
+    of suffixes, prefixes and
+    words from all the names of
+    the input group and returns
+    the ``set`` of the new names.
+
+    Parameters
+    ----------
+    group: list
+        ``list`` of names.
+    skip_suffix: list, optional
+        ``list`` of suffixes to exclude.
+    skip_prefix: list, optional
+        ``list`` of prefixes to exclude.
+    skip_word: list, optional
+        ``list`` of words to exclude.
+    order: list, optional
+        The order of the process.
+
+         - s:
+            suffix.
+         - p:
+            prefix.
+         - w:
+            word.
+        For example, the ``list``
+        ``["p", "s", "w"]`` will
+        start by excluding the
+        prefixes, then suffixes,
+        and finally the input words.
+
+    Returns
+    -------
+    frozenset
+        The canonical names
+        of the group.
+
+    Examples
+    --------
+    The following code demonstrates
+    the usage of the function.
+
+    .. ipython:: python
+
+        # Import the function.
+        from verticapy._utils._sql._merge import precompute_group
+
+        # Generates a group and a list of words.
+        group = ['country.city.lat', 'country.region.lon']
+        word = ['country.city.', 'country.region.']
+
+        # Example.
+        precompute_group(group, skip_word = word)
+
+    .. note::
+
+        These functions serve as utilities to
+        construct others, simplifying the overall
+        code.
+    """
+    order = format_type(order, dtype=list, na_out=["p", "s", "w"])
+    skip_suffix, skip_prefix, skip_word = format_type(
+        skip_suffix, skip_prefix, skip_word, dtype=list
+    )
+    try:
+        return _precompute_group(
+            tuple(group),
+            tuple(skip_suffix),
+            tuple(skip_prefix),
+            tuple(skip_word),
+            tuple(order),
+        )
+    except TypeError:
+        # Unhashable inputs can not be cached.
+        return frozenset(
+            erase_in_name(
+                name=n,
+                suffix=skip_suffix,
+                prefix=skip_prefix,
+                word=skip_word,
+                order=order,
+            )
+            for n in group
+        )
+
+
 def belong_to_group(
     name: str,
     group: list,
@@ -435,17 +644,21 @@ def belong_to_group(
     skip_suffix, skip_prefix, skip_word = format_type(
         skip_suffix, skip_prefix, skip_word, dtype=list
     )
-    for name2 in group:
-        if is_similar_name(
-            name1=name,
-            name2=name2,
-            skip_suffix=skip_suffix,
-            skip_prefix=skip_prefix,
-            skip_word=skip_word,
-            order=order,
-        ):
-            return True
-    return False
+    canonical_group = precompute_group(
+        group=group,
+        skip_suffix=skip_suffix,
+        skip_prefix=skip_prefix,
+        skip_word=skip_word,
+        order=order,
+    )
+    canonical_name = erase_in_name(
+        name=name,
+        suffix=skip_suffix,
+        prefix=skip_prefix,
+        word=skip_word,
+        order=order,
+    )
+    return canonical_name in canonical_group
 
 
 def group_similar_names(
@@ -517,19 +730,27 @@ def group_similar_names(
     skip_suffix, skip_prefix, skip_word = format_type(
         skip_suffix, skip_prefix, skip_word, dtype=list
     )
-    result = {}
-    for col in colnames:
-        groupname = erase_in_name(
-            name=col,
+    skip_suffix, skip_prefix, skip_word, order = (
+        tuple(skip_suffix),
+        tuple(skip_prefix),
+        tuple(skip_word),
+        tuple(order),
+    )
+
+    @lru_cache(maxsize=None)
+    def _cached_erase(name: str) -> str:
+        return erase_in_name(
+            name=name,
             suffix=skip_suffix,
             prefix=skip_prefix,
             word=skip_word,
             order=order,
         )
-        if groupname not in result:
-            result[groupname] = [col]
-        else:
-            result[groupname] += [col]
+
+    result = {}
+    result_setdefault = result.setdefault
+    for col in colnames:
+        result_setdefault(_cached_erase(col), []).append(col)
     return result
 
 
@@ -576,14 +797,12 @@ def gen_coalesce(group_dict: dict) -> str:
         construct others, simplifying the overall
         code.
     """
-    result = []
-    for g in group_dict:
-        L = quote_ident(group_dict[g])
+
+    def _coalesce_one(g: str, cols: list) -> str:
+        L = quote_ident(cols)
         g_ident = quote_ident(g)
         if len(L) == 1:
-            sql_tmp = quote_ident(group_dict[g][0])
-            result += [f"{sql_tmp} AS {g_ident}"]
-        else:
-            sql_tmp = ", ".join(L)
-            result += [f"COALESCE({sql_tmp}) AS {g_ident}"]
-    return ",\n".join(result)
+            return f"{L[0]} AS {g_ident}"
+        return f"COALESCE({', '.join(L)}) AS {g_ident}"
+
+    return ",\n".join(_coalesce_one(g, cols) for g, cols in group_dict.items())
@@ -17,6 +17,8 @@ permissions and limitations under the License.
 import time
 from typing import Any, Literal, Optional
 
+import numpy as np
+
 import verticapy._config.config as conf
 from verticapy.connection.global_connection import get_global_connection
 from verticapy._typing import NoneType
@@ -36,7 +38,13 @@ def _executeSQL(
     title: Optional[str] = None,
     data: Optional[list] = None,
     method: Literal[
-        "cursor", "fetchrow", "fetchall", "fetchfirstelem", "copy"
+        "cursor",
+        "fetchrow",
+        "fetchall",
+        "fetchfirstelem",
+        "fetchcol",
+        "fetchnumpy",
+        "copy",
     ] = "cursor",
     path: Optional[str] = None,
     print_time_sql: bool = True,
@@ -75,6 +83,15 @@ def _executeSQL(
          - fetchfirstelem:
             Executes the query and returns
             the first element.
+         - fetchcol:
+            Executes the query and returns
+            the first column as a ``list``.
+            The rows are fetched by chunks.
+         - fetchnumpy:
+            Executes the query and returns
+            the entire result as a 2D object
+            ``numpy.array``. The rows are
+            fetched by chunks.
          - copy:
             Ingests the data and returns
             the cursor.
@@ -191,4 +208,21 @@ def _executeSQL(
         return cursor.fetchone()[0]
     elif method == "fetchall":
         return cursor.fetchall()
+    elif method == "fetchcol":
+        res = []
+        while rows := cursor.fetchmany(8192):
+            res += [row[0] for row in rows]
+        return res
+    elif method == "fetchnumpy":
+        ncols = len(cursor.description)
+        chunks = [np.empty((0, ncols), dtype=object)]
+        while rows := cursor.fetchmany(8192):
+            # The chunk is filled cell by cell: letting NumPy infer the
+            # shape would split the ARRAY / ROW values into new axes.
+            chunk = np.empty((len(rows), ncols), dtype=object)
+            for i, row in enumerate(rows):
+                for j, val in enumerate(row):
+                    chunk[i, j] = val
+            chunks += [chunk]
+        return np.concatenate(chunks)
     return cursor
@@ -18,7 +18,7 @@ from functools import wraps
 from typing import Any, Callable, Optional
 
 from verticapy._utils._sql._format import format_type
-from verticapy.connection.connect import current_cursor
+from verticapy.connection.connect import current_connection
 from verticapy.errors import VersionError
 
 MINIMUM_VERTICA_VERSION = {
@@ -119,6 +119,40 @@ def check_minimum_version(func: Callable) -> Callable:
     return func_prec_check_minimum_version
 
 
+# The server version can not change during the life of a connection:
+# it is queried once and stored with the connection it belongs to.
+_VERSION_CACHE = {"conn": None, "version": None}
+
+
+def _get_server_version() -> tuple:
+    """
+    Returns the version of the server of
+    the current connection. The query is
+    only sent once per connection.
+    """
+    conn = current_connection()
+    if _VERSION_CACHE["conn"] is not conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT /*+LABEL('_version')*/ version();")
+        current_version = cursor.fetchone()[0]
+        current_version = current_version.split("Vertica Analytic Database v")[1]
+        current_version = current_version.split(".")
+        res = []
+        try:
+            res += [int(current_version[0])]
+            res += [int(current_version[1])]
+            minor_version = current_version[2].split("-")
+            res += [int(minor_version[0])]
+            if len(minor_version) > 1:
+                # this is hotfix version
+                res += [int(minor_version[1])]
+        except TypeError:
+            pass
+        _VERSION_CACHE["conn"] = conn
+        _VERSION_CACHE["version"] = tuple(res)
+    return _VERSION_CACHE["version"]
+
+
 def vertica_version(condition: Optional[list] = None) -> tuple[int, int, int, int]:
     """
     Returns the Vertica Version.
@@ -172,21 +206,7 @@ def vertica_version(condition: Optional[list] = None) -> tuple[int, int, int, in
     condition = format_type(condition, dtype=list)
     if len(condition) > 0:
         condition = condition + [0 for elem in range(4 - len(condition))]
-    current_cursor().execute("SELECT /*+LABEL('_version')*/ version();")
-    current_version = current_cursor().fetchone()[0]
-    current_version = current_version.split("Vertica Analytic Database v")[1]
-    current_version = current_version.split(".")
-    res = []
-    try:
-        res += [int(current_version[0])]
-        res += [int(current_version[1])]
-        minor_version = current_version[2].split("-")
-        res += [int(minor_version[0])]
-        if len(minor_version) > 1:
-            # this is hotfix version
-            res += [int(minor_version[1])]
-    except TypeError:
-        pass
+    res = list(_get_server_version())
     if condition:
         if condition[0] < res[0]:
             test = True
@@ -1085,14 +1085,13 @@ class TableSample:
                         columns[idx] += f"_{j}"
                     j += 1
 
-        data_columns = [[item] for item in columns]
-        data = list(result)
-        for row in data:
-            for idx, val in enumerate(row):
-                data_columns[idx] += [val]
+        if result:
+            data_columns = zip(*result)
+        else:
+            data_columns = [()] * len(columns)
         values = {}
-        for column in data_columns:
-            values[column[0]] = column[1 : len(column)]
+        for column, data in zip(columns, data_columns):
+            values[column] = list(data)
         return cls(
             values=values,
             dtype=dtype,
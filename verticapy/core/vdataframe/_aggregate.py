@@ -15,6 +15,7 @@ See the  License for the specific  language governing
 permissions and limitations under the License.
 """
 import decimal
+import math
 import multiprocessing
 from typing import Literal, Optional, Union
 import warnings
@@ -298,6 +299,9 @@ class vDFAgg(vDFEval):
 
         # Some aggregations are using some others. We need to precompute them.
 
+        # They are computed for all the columns at once to avoid
+        # one query per column.
+
         for fun in func:
             if fun.lower() in [
                 "kurtosis",
@@ -305,6 +309,7 @@ class vDFAgg(vDFEval):
                 "skewness",
                 "skew",
                 "jb",
+                "aad",
             ]:
                 count_avg_stddev = (
                     self.aggregate(func=["count", "avg", "stddev"], columns=columns)
@@ -313,6 +318,14 @@ class vDFAgg(vDFEval):
                 )
                 break
 
+        if "mad" in (fun.lower() for fun in func):
+            # Same catalog key as vDataColumn.median.
+            medians = (
+                self.aggregate(func=["approx_50.0%"], columns=columns)
+                .transpose()
+                .values
+            )
+
         # Computing iteratively aggregations using block of columns.
 
         if ncols_block < len(columns) and processes <= 1:
@@ -347,6 +360,9 @@ class vDFAgg(vDFEval):
 
         agg = [[] for i in range(len(columns))]
         nb_precomputed = 0
+        # Python values of the precomputed aggregations, used when
+        # no query is needed.
+        precomputed = []
 
         # Computing all the other aggregations.
 
@@ -359,11 +375,14 @@ class vDFAgg(vDFEval):
                     nb_precomputed += 1
                     if isinstance(pre_comp, NoneType) or pre_comp != pre_comp:
                         expr = "NULL"
+                        precomputed += [None]
                     elif isinstance(pre_comp, (int, float)):
                         expr = pre_comp
+                        precomputed += [pre_comp]
                     else:
                         pre_comp_str = str(pre_comp).replace("'", "''")
                         expr = f"'{pre_comp_str}'"
+                        precomputed += [str(pre_comp)]
 
                 elif fun.lower().endswith("_percent") and fun.lower().startswith("top"):
                     n = fun.lower().replace("top", "").replace("_percent", "")
@@ -539,14 +558,26 @@ class vDFAgg(vDFEval):
                                 END)"""
 
                 elif fun.lower() == "sem":
-                    expr = f"STDDEV({column}{cast}) / SQRT(COUNT({column}))"
+                    std = self._get_catalog_value(column, "stddev")
+                    cnt = self._get_catalog_value(column, "count")
+                    if (
+                        isinstance(std, (int, float))
+                        and isinstance(cnt, (int, float))
+                        and cnt > 0
+                    ):
+                        # Derived from the already computed moments.
+                        nb_precomputed += 1
+                        expr = std / math.sqrt(cnt)
+                        precomputed += [expr]
+                    else:
+                        expr = f"STDDEV({column}{cast}) / SQRT(COUNT({column}))"
 
                 elif fun.lower() == "aad":
-                    mean = self[column].avg()
+                    mean = count_avg_stddev[column][1]
                     expr = f"SUM(ABS({column}{cast} - {mean})) / COUNT({column})"
 
                 elif fun.lower() == "mad":
-                    median = self[column].median()
+                    median = medians[column][0]
                     expr = f"APPROXIMATE_MEDIAN(ABS({column}{cast} - {median}))"
 
                 elif fun.lower() in ("prod", "product"):
@@ -560,10 +591,10 @@ class vDFAgg(vDFEval):
                         POWER(10, SUM(LOG(ABS({column}{cast}))))"""
 
                 elif fun.lower() in ("percent", "count_percent"):
-                    if self.shape()[0] == 0:
+                    if (n := self.shape()[0]) == 0:
                         expr = "100.0"
                     else:
-                        expr = f"ROUND(COUNT({column}) / {self.shape()[0]} * 100, 3)::float"
+                        expr = f"ROUND(COUNT({column}) / {n} * 100, 3)::float"
 
                 elif "{}" not in fun:
                     expr = f"{fun.upper()}({column}{cast})"
@@ -589,14 +620,7 @@ class vDFAgg(vDFEval):
 
         try:
             if nb_precomputed == len(func) * len(columns):
-                res = _executeSQL(
-                    query=f"""
-                        SELECT 
-                            /*+LABEL('vDataframe.aggregate')*/ 
-                            {", ".join([str(item) for sublist in agg for item in sublist])}""",
-                    print_time_sql=False,
-                    method="fetchrow",
-                )
+                res = precomputed
             else:
                 res = _executeSQL(
                     query=f"""
@@ -622,6 +646,8 @@ class vDFAgg(vDFEval):
                 i += len(func)
 
         except QueryError:
+            # The relation is generated once for all the fallback queries.
+            relation = self._genSQL()
             try:
                 query = [
                     "SELECT {0} FROM vdf_table LIMIT 1".format(
@@ -643,7 +669,7 @@ class vDFAgg(vDFEval):
                     WITH vdf_table AS 
                         (SELECT 
                             /*+LABEL('vDataframe.aggregate')*/ * 
-                         FROM {self}) {query}"""
+                         FROM {relation}) {query}"""
                 if nb_precomputed == len(func) * len(columns):
                     result = _executeSQL(query, print_time_sql=False, method="fetchall")
                 else:
@@ -676,7 +702,7 @@ class vDFAgg(vDFEval):
                                         SELECT 
                                             /*+LABEL('vDataframe.aggregate')*/ 
                                             {columns_str} 
-                                        FROM {self}""",
+                                        FROM {relation}""",
                                     title=(
                                         "Computing the different aggregations one "
                                         "vDataColumn at a time."
@@ -704,7 +730,7 @@ class vDFAgg(vDFEval):
                                         SELECT 
                                             /*+LABEL('vDataframe.aggregate')*/ 
                                             {agg_fun} 
-                                        FROM {self}""",
+                                        FROM {relation}""",
                                     title=(
                                         "Computing the different aggregations one "
                                         "vDataColumn & one agg at a time."
@@ -3781,11 +3807,13 @@ class vDCAgg(vDCEval):
         assert (method != "cat_stats") or (numcol), ValueError(
             "The parameter 'numcol' must be a vDataFrame column if the method is 'cat_stats'"
         )
-        distinct_count, is_numeric, is_date = (
-            self.nunique(),
-            self.isnum(),
-            self.isdate(),
-        )
+        is_numeric, is_date = self.isnum(), self.isdate()
+        if method != "cat_stats" and (not is_date or method == "categorical"):
+            # The number of distinct values and the count are
+            # computed together in a single query.
+            distinct_count, count = self.aggregate(["approx_unique", "count"]).values[
+                self._alias
+            ]
         if (is_date) and method != "categorical":
             result = self.aggregate(["count", "min", "max"])
             index = result.values["index"]
@@ -3796,15 +3824,11 @@ class vDCAgg(vDCEval):
                 "The column 'numcol' must be numerical"
             )
             cast = "::int" if (self._parent[numcol].isbool()) else ""
-            query, cat = [], self.distinct()
-            if len(cat) == 1:
-                lp, rp = "(", ")"
-            else:
-                lp, rp = "", ""
-            for category in cat:
-                tmp_query = f"""
+            alias_sql_repr = to_varchar(self.category(), self._alias)
+            values = TableSample.read_sql(
+                query=f"""
                     SELECT 
-                        '{category}' AS 'index', 
+                        ({alias_sql_repr})::varchar AS 'index', 
                         COUNT({self}) AS count, 
                         100 * COUNT({self}) / {self._parent.shape()[0]} AS percent, 
                         AVG({numcol}{cast}) AS mean, 
@@ -3821,20 +3845,10 @@ class vDCAgg(vDCEval):
                         APPROXIMATE_PERCENTILE ({numcol}{cast} 
                             USING PARAMETERS percentile = 0.9) AS 'approx_90%', 
                         MAX({numcol}{cast}) AS max 
-                   FROM vdf_table"""
-                if category in ("None", None):
-                    tmp_query += f" WHERE {self} IS NULL"
-                else:
-                    alias_sql_repr = to_varchar(self.category(), self._alias)
-                    tmp_query += f" WHERE {alias_sql_repr} = '{category}'"
-                query += [lp + tmp_query + rp]
-            values = TableSample.read_sql(
-                query=f"""
-                    WITH vdf_table AS 
-                        (SELECT 
-                            * 
-                        FROM {self._parent}) 
-                        {' UNION ALL '.join(query)}""",
+                    FROM {self._parent} 
+                    WHERE {self} IS NOT NULL 
+                    GROUP BY {self} 
+                    ORDER BY {self}""",
                 title=f"Describes the statics of {numcol} partitioned by {self}.",
                 sql_push_ext=self._parent._vars["sql_push_ext"],
                 symbol=self._parent._vars["symbol"],
@@ -3876,8 +3890,10 @@ class vDCAgg(vDCEval):
                 sql_push_ext=self._parent._vars["sql_push_ext"],
                 symbol=self._parent._vars["symbol"],
             )
-            result = [distinct_count, self.count()] + [item[1] for item in query_result]
-            index = ["unique", "count"] + [item[0] for item in query_result]
+            result, index = [distinct_count, count], ["unique", "count"]
+            for label, cnt in query_result:
+                index.append(label)
+                result.append(cnt)
         else:
             result = (
                 self._parent.describe(
@@ -3908,9 +3924,9 @@ class vDCAgg(vDCEval):
             ):
                 self._parent._update_catalog({"index": index, self._alias: result})
         for elem in values:
-            for i in range(len(values[elem])):
-                if isinstance(values[elem][i], decimal.Decimal):
-                    values[elem][i] = float(values[elem][i])
+            values[elem] = [
+                float(x) if isinstance(x, decimal.Decimal) else x for x in values[elem]
+            ]
         return TableSample(values)
 
     # Single Aggregate Functions.
@@ -4793,11 +4809,11 @@ class vDCAgg(vDCEval):
                 ORDER BY _verticapy_cnt_ ASC 
                 LIMIT 1""",
             title="Computing the mode.",
-            method="fetchall",
+            method="fetchrow",
             sql_push_ext=self._parent._vars["sql_push_ext"],
             symbol=self._parent._vars["symbol"],
         )
-        top = None if not result else result[0][0]
+        top = None if not result else result[0]
         if not dropna:
             n = "" if (n == 1) else str(int(n))
             if isinstance(top, decimal.Decimal):
@@ -4955,7 +4971,7 @@ class vDCAgg(vDCEval):
         if dropna:
             where = f" WHERE {self} IS NOT NULL"
         alias_sql_repr = to_varchar(self.category(), self._alias)
-        result = _executeSQL(
+        cursor = _executeSQL(
             query=f"""
             SELECT 
                 /*+LABEL('vDataColumn.topk')*/
@@ -4968,15 +4984,19 @@ class vDCAgg(vDCEval):
             ORDER BY _verticapy_cnt_ DESC
             {limit}""",
             title=f"Computing the top{topk_cat} categories of {self}.",
-            method="fetchall",
+            method="cursor",
             sql_push_ext=self._parent._vars["sql_push_ext"],
             symbol=self._parent._vars["symbol"],
         )
-        values = {
-            "index": [item[0] for item in result],
-            "count": [int(item[1]) for item in result],
-            "percent": [float(round(item[2], 3)) for item in result],
-        }
+        # The rows are read in chunks and written straight into the
+        # output lists, so the whole result is never held twice.
+        index, count, percent = [], [], []
+        while rows := cursor.fetchmany(8192):
+            for row in rows:
+                index.append(row[0])
+                count.append(int(row[1]))
+                percent.append(float(round(row[2], 3)))
+        values = {"index": index, "count": count, "percent": percent}
         return TableSample(values)
 
     # Distincts.
@@ -5019,6 +5039,13 @@ class vDCAgg(vDCEval):
             | ``vDataColumn.``:py:meth:`~verticapy.vDataColumn.aggregate` : Aggregations for a specific column.
             | ``vDataFrame.``:py:meth:`~verticapy.vDataFrame.aggregate` : Aggregates for particular columns.
         """
+        if "agg" not in kwargs:
+            # The categories are stored with the state of the
+            # vDataColumn transformations they were computed on.
+            state = (len(self._transf), self._transf[-1])
+            pre_comp = self._parent._get_catalog_value(self._alias, "distinct")
+            if pre_comp != "VERTICAPY_NOT_PRECOMPUTED" and pre_comp[0] == state:
+                return list(pre_comp[1])
         alias_sql_repr = to_varchar(self.category(), self._alias)
         if "agg" not in kwargs:
             query = f"""
@@ -5041,14 +5068,18 @@ class vDCAgg(vDCEval):
                      WHERE {self} IS NOT NULL 
                      GROUP BY 1) x 
                 ORDER BY verticapy_agg DESC"""
-        query_result = _executeSQL(
+        result = _executeSQL(
             query=query,
             title=f"Computing the distinct categories of {self}.",
-            method="fetchall",
+            method="fetchcol",
             sql_push_ext=self._parent._vars["sql_push_ext"],
             symbol=self._parent._vars["symbol"],
         )
-        return [item for sublist in query_result for item in sublist]
+        if "agg" not in kwargs:
+            self._parent._update_catalog(
+                {"index": ["distinct"], self._alias: [(state, tuple(result))]}
+            )
+        return result
 
     @save_verticapy_logs
     def nunique(self, approx: bool = True) -> int:
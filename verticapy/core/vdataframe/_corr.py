@@ -1558,6 +1558,7 @@ class vDFCorr(vDFEncode):
         except QueryError:
             n = len(columns)
             result = []
+            relation = self._genSQL()
             for i in range(0, n):
                 for j in range(0, n):
                     result += [
@@ -1567,7 +1568,7 @@ class vDFCorr(vDFEncode):
                                     /*+LABEL('vDataframe.regr')*/ 
                                     {method.upper()}({columns[i]}{cast_i}, 
                                                      {columns[j]}{cast_j}) 
-                                FROM {self}""",
+                                FROM {relation}""",
                             title=f"Computing the {method.upper()} aggregation, one at a time.",
                             method="fetchfirstelem",
                             sql_push_ext=self._vars["sql_push_ext"],
@@ -14,7 +14,6 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
-import copy
 import math
 import warnings
 from typing import Literal, Optional, TYPE_CHECKING
@@ -25,7 +24,7 @@ from verticapy._utils._gen import gen_tmp_name
 from verticapy._utils._object import get_vertica_mllib, create_new_vdc
 from verticapy._utils._sql._cast import to_varchar
 from verticapy._utils._sql._collect import save_verticapy_logs
-from verticapy._utils._sql._format import format_type
+from verticapy._utils._sql._format import format_type, quote_ident
 from verticapy._utils._sql._sys import _executeSQL
 
 from verticapy.core.string_sql.base import StringSQL
@@ -39,6 +38,21 @@ if TYPE_CHECKING:
     from verticapy.core.vdataframe.base import vDataFrame
 
 
+def _bins_search_tree(edges: list, start: int, end: int) -> str:
+    """
+    Returns a CASE expression finding the interval of {}
+    among [edges[i - 1];edges[i]] for i in [start, end]
+    by binary search. A value equal to an edge belongs
+    to the first interval containing it.
+    """
+    if start == end:
+        return f"'[{edges[start - 1]};{edges[start]}]'"
+    mid = (start + end) // 2
+    left = _bins_search_tree(edges, start, mid)
+    right = _bins_search_tree(edges, mid + 1, end)
+    return f"(CASE WHEN {{}} <= {edges[mid]} THEN {left} ELSE {right} END)"
+
+
 class vDFEncode(vDFFill):
     @save_verticapy_logs
     def case_when(self, name: str, *args) -> "vDataFrame":
@@ -342,8 +356,10 @@ class vDFEncode(vDFFill):
         if len(columns) == 0:
             columns = self.get_columns()
         cols_hand = True if (columns) else False
+        # All the cardinalities are computed in a single query.
+        nunique = self.nunique(columns, approx=True).transpose().values
         for column in columns:
-            if self[column].nunique(True) < max_cardinality:
+            if nunique[column][0] < max_cardinality:
                 self[column].one_hot_encode(
                     "", prefix_sep, drop_first, use_numbers_as_suffix
                 )
@@ -1025,7 +1041,9 @@ class vDCEncode(vDCFill):
         """
         RFmodel_params = format_type(RFmodel_params, dtype=dict)
         vml = get_vertica_mllib()
-        if self.isnum() and method == "smart":
+        category = self.category()
+        is_num = category in ("float", "int")
+        if is_num and method == "smart":
             schema = conf.get_option("temp_schema")
             tmp_view_name = gen_tmp_name(schema=schema, name="view")
             assert nbins >= 2, ValueError(
@@ -1045,7 +1063,6 @@ class vDCEncode(vDCFill):
                 model = vml.RandomForestClassifier()
             model.set_params({"n_estimators": 20, "max_depth": 8, "nbins": 100})
             model.set_params(RFmodel_params)
-            parameters = model.get_params()
             try:
                 model.fit(
                     tmp_view_name,
@@ -1053,15 +1070,7 @@ class vDCEncode(vDCFill):
                     response,
                     return_report=True,
                 )
-                query = [
-                    f"""
-                    (SELECT 
-                        READ_TREE(USING PARAMETERS 
-                            model_name = '{model.model_name}', 
-                            tree_id = {i}, 
-                            format = 'tabular'))"""
-                    for i in range(parameters["n_estimators"])
-                ]
+                # Without tree_id, READ_TREE returns all the trees.
                 query = f"""
                     SELECT 
                         /*+LABEL('vDataColumn.discretize')*/ split_value 
@@ -1069,29 +1078,33 @@ class vDCEncode(vDCFill):
                         (SELECT 
                             split_value, 
                             MAX(weighted_information_gain) 
-                        FROM ({' UNION ALL '.join(query)}) VERTICAPY_SUBTABLE 
+                        FROM 
+                            (SELECT 
+                                READ_TREE(USING PARAMETERS 
+                                    model_name = '{model.model_name}', 
+                                    format = 'tabular')) VERTICAPY_SUBTABLE 
                         WHERE split_value IS NOT NULL 
                         GROUP BY 1 ORDER BY 2 DESC LIMIT {nbins - 1}) VERTICAPY_SUBTABLE 
                     ORDER BY split_value::float"""
                 result = _executeSQL(
                     query=query,
                     title="Computing the optimized histogram nbins using Random Forest.",
-                    method="fetchall",
+                    method="fetchcol",
                     sql_push_ext=self._parent._vars["sql_push_ext"],
                     symbol=self._parent._vars["symbol"],
                 )
-                result = [x[0] for x in result]
             finally:
                 drop(tmp_view_name, method="view")
                 model.drop()
-            result = [self.min()] + result + [self.max()]
+            min_, max_ = self.aggregate(["min", "max"]).values[self._alias]
+            result = [min_] + result + [max_]
         elif method == "topk":
             assert k >= 2, ValueError(
                 "Parameter 'k' must be greater or equals to 2 in "
                 "case of discretization using the method 'topk'"
             )
             distinct = self.topk(k).values["index"]
-            category_str = to_varchar(self.category())
+            category_str = to_varchar(category)
             X_str = ", ".join([f"""'{str(x).replace("'", "''")}'""" for x in distinct])
             new_category_str = new_category.replace("'", "''")
             trans = (
@@ -1103,54 +1116,53 @@ class vDCEncode(vDCFill):
                 "varchar",
                 "text",
             )
-        elif self.isnum() and method == "same_freq":
+        elif is_num and method == "same_freq":
             assert nbins >= 2, ValueError(
                 "Parameter 'nbins' must be greater or equals to 2 in case "
                 "of discretization using the method 'same_freq'"
             )
-            count = self.count()
-            nb = int(float(count / int(nbins)))
-            assert nb != 0, Exception(
-                "Not enough values to compute the Equal Frequency discretization"
+            cast = "::int" if self.isbool() else ""
+            percentiles = ", ".join(
+                f"""
+                    APPROXIMATE_PERCENTILE({self}{cast} 
+                        USING PARAMETERS percentile = {i / nbins})"""
+                for i in range(1, int(nbins))
             )
-            total, query, nth_elems = nb, [], []
-            while total < int(float(count / int(nbins))) * int(nbins):
-                nth_elems += [str(total)]
-                total += nb
-            possibilities = ", ".join(["1"] + nth_elems + [str(count)])
-            where = f"WHERE _verticapy_row_nb_ IN ({possibilities})"
             query = f"""
                 SELECT /*+LABEL('vDataColumn.discretize')*/ 
-                    {self} 
-                FROM (SELECT 
-                        {self}, 
-                        ROW_NUMBER() OVER (ORDER BY {self}) AS _verticapy_row_nb_ 
-                      FROM {self._parent} 
-                      WHERE {self} IS NOT NULL) VERTICAPY_SUBTABLE {where}"""
-            result = _executeSQL(
+                    COUNT({self}), 
+                    MIN({self}{cast}), 
+                    {percentiles}, 
+                    MAX({self}{cast}) 
+                FROM {self._parent} 
+                WHERE {self} IS NOT NULL"""
+            count, *result = _executeSQL(
                 query=query,
                 title="Computing the equal frequency histogram bins.",
-                method="fetchall",
+                method="fetchrow",
                 sql_push_ext=self._parent._vars["sql_push_ext"],
                 symbol=self._parent._vars["symbol"],
             )
-            result = [elem[0] for elem in result]
-        elif self.isnum() and not (self.isbool()) and method in ("same_width", "auto"):
+            assert int(count / int(nbins)) != 0, Exception(
+                "Not enough values to compute the Equal Frequency discretization"
+            )
+        elif is_num and not (self.isbool()) and method in ("same_width", "auto"):
             if not h or h <= 0:
                 if nbins <= 0:
                     h = self.numh()
                 else:
-                    h = (self.max() - self.min()) * 1.01 / nbins
+                    min_, max_ = self.aggregate(["min", "max"]).values[self._alias]
+                    h = (max_ - min_) * 1.01 / nbins
                 if h > 0.01:
                     h = round(h, 2)
                 elif h > 0.0001:
                     h = round(h, 4)
                 elif h > 0.000001:
                     h = round(h, 6)
-                if self.category() == "int":
+                if category == "int":
                     h = int(max(math.floor(h), 1))
-            floor_end = -1 if (self.category() == "int") else ""
-            if (h > 1) or (self.category() == "float"):
+            floor_end = -1 if (category == "int") else ""
+            if (h > 1) or (category == "float"):
                 trans = (
                     f"'[' || FLOOR({{}} / {h}) * {h} || ';' || (FLOOR({{}} / {h}) * {h} + {h}{floor_end}) || ']'",
                     "varchar",
@@ -1160,32 +1172,29 @@ class vDCEncode(vDCFill):
                 trans = ("FLOOR({}) || ''", "varchar", "text")
         else:
             trans = ("{} || ''", "varchar", "text")
-        if (self.isnum() and method == "same_freq") or (
-            self.isnum() and method == "smart"
-        ):
+        if is_num and method in ("same_freq", "smart"):
+            # The edges are sorted: the interval is found with a
+            # binary search instead of testing each of them.
             n = len(result)
-            trans = "(CASE "
-            for i in range(1, n):
-                trans += f"""
-                    WHEN {{}} 
-                        BETWEEN {result[i - 1]} 
-                        AND {result[i]} 
-                    THEN '[{result[i - 1]};{result[i]}]' """
-            trans += " ELSE NULL END)"
-            trans = (trans, "varchar", "text")
+            trans = (
+                f"(CASE WHEN {{}} BETWEEN {result[0]} AND {result[-1]} "
+                f"THEN {_bins_search_tree(result, 1, n - 1)} ELSE NULL END)",
+                "varchar",
+                "text",
+            )
         if return_enum_trans:
             return trans
         else:
             self._transf += [trans]
-            sauv = copy.deepcopy(self._catalog)
+            count = self._catalog.get("count")
             self._parent._update_catalog(erase=True, columns=[self._alias])
-            if "count" in sauv:
-                self._catalog["count"] = sauv["count"]
+            if count is not None:
+                self._catalog["count"] = count
                 parent_cnt = self._parent.shape()[0]
                 if parent_cnt == 0:
                     self._catalog["percent"] = 100
                 else:
-                    self._catalog["percent"] = 100 * sauv["count"] / parent_cnt
+                    self._catalog["percent"] = 100 * count / parent_cnt
             self._parent._add_to_history(
                 f"[Discretize]: The vDataColumn {self} was discretized."
             )
@@ -1344,13 +1353,17 @@ class vDCEncode(vDCFill):
             else:
                 prefix = prefix.replace('"', "_") + prefix_sep.replace('"', "_")
             n = 1 if drop_first else 0
+            parent_cnt = self._parent.shape()[0]
+            all_columns = {
+                quote_ident(col).lower() for col in self._parent.get_columns()
+            }
             for k in range(len(distinct_elements) - n):
                 distinct_elements_k = str(distinct_elements[k]).replace('"', "_")
                 if use_numbers_as_suffix:
                     name = f'"{prefix}{k}"'
                 else:
                     name = f'"{prefix}{distinct_elements_k}"'
-                assert not self._parent.is_colname_in(name), NameError(
+                assert quote_ident(name).lower() not in all_columns, NameError(
                     "A vDataColumn has already the alias of one of "
                     f"the dummies ({name}).\nIt can be the result "
                     "of using previously the method on the vDataColumn "
@@ -1380,7 +1393,7 @@ class vDCEncode(vDCFill):
                     catalog={
                         "min": 0,
                         "max": 1,
-                        "count": self._parent.shape()[0],
+                        "count": parent_cnt,
                         "percent": 100.0,
                         "unique": 2,
                         "approx_unique": 2,
@@ -1498,13 +1511,14 @@ class vDCEncode(vDCFill):
             warnings.warn(warning_message, Warning)
         else:
             distinct_elements = self.distinct()
-            expr = ["DECODE({}"]
-            text_info = "\n"
-            for k in range(len(distinct_elements)):
-                distinct_elements_k = str(distinct_elements[k]).replace("'", "''")
-                expr += [f"'{distinct_elements_k}', {k}"]
-                text_info += f"\t{distinct_elements[k]} => {k}"
-            expr = f"{', '.join(expr)}, {len(distinct_elements)})"
+            mapping = "".join(
+                ", '" + str(elem).replace("'", "''") + f"', {k}"
+                for k, elem in enumerate(distinct_elements)
+            )
+            expr = f"DECODE({{}}{mapping}, {len(distinct_elements)})"
+            text_info = "\n" + "".join(
+                f"\t{elem} => {k}" for k, elem in enumerate(distinct_elements)
+            )
             self._transf += [(expr, "int", "int")]
             self._parent._update_catalog(erase=True, columns=[self._alias])
             self._catalog["count"] = self._parent.shape()[0]
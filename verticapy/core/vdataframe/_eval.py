@@ -14,7 +14,6 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
-import re
 from typing import Any, Union, TYPE_CHECKING
 
 from vertica_python.errors import QueryError
@@ -265,21 +264,14 @@ class vDFEval(vDFInOut):
             ctype = "VMAP(" + "(".join(ctype.split("(")[1:]) if "(" in ctype else "VMAP"
         else:
             category = to_category(ctype=ctype)
-        all_cols, max_floor = self.get_columns(), 0
-        for column in all_cols:
-            column_str = column.replace('"', "")
-            if (quote_ident(column) in expr) or (
-                re.search(re.compile(f"\\b{column_str}\\b"), expr)
-            ):
-                max_floor = max(len(self[column]._transf), max_floor)
+        max_floor = self._get_max_floor(expr)
         transformations = [
             (
                 "___VERTICAPY_UNDEFINED___",
                 "___VERTICAPY_UNDEFINED___",
                 "___VERTICAPY_UNDEFINED___",
             )
-            for i in range(max_floor)
-        ] + [(expr, ctype, category)]
+        ] * max_floor + [(expr, ctype, category)]
         new_vDataColumn = create_new_vdc(
             name, parent=self, transformations=transformations
         )
@@ -295,5 +287,4 @@ class vDFEval(vDFInOut):
 
 
 class vDCEval(vDCSystem):
-    def __setattr__(self, attr: str, val: Any) -> None:
-        self.__dict__[attr] = val
+    ...
@@ -14,8 +14,8 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
-import copy
 import datetime
+import itertools
 import warnings
 from typing import Literal, Optional, Union, TYPE_CHECKING
 
@@ -394,11 +394,10 @@ class vDFFill(vDFPivot):
             else:
                 func, interp = "TS_FIRST_VALUE", "linear"
             all_elements += [f"{func}({column}, '{interp}') AS {column}"]
-        query = f"SELECT {{}} FROM {self}"
         tmp_query = [f"slice_time AS {quote_ident(ts)}"]
         tmp_query += quote_ident(by)
         tmp_query += all_elements
-        query = query.format(", ".join(tmp_query))
+        query = f"SELECT {', '.join(tmp_query)} FROM {self}"
         partition = ""
         if by:
             partition = ", ".join(quote_ident(by))
@@ -514,17 +513,11 @@ class vDCFill(vDCMath):
         assert (not isinstance(lower, NoneType)) or (
             not isinstance(upper, NoneType)
         ), ValueError("At least 'lower' or 'upper' must have a numerical value")
-        lower_when = (
-            f"WHEN {{}} < {lower} THEN {lower} "
-            if (isinstance(lower, (float, int)))
-            else ""
-        )
-        upper_when = (
-            f"WHEN {{}} > {upper} THEN {upper} "
-            if (isinstance(upper, (float, int)))
-            else ""
-        )
-        func = f"(CASE {lower_when}{upper_when}ELSE {{}} END)"
+        func = "{}"
+        if isinstance(lower, (float, int)):
+            func = f"GREATEST({func}, {lower})"
+        if isinstance(upper, (float, int)):
+            func = f"LEAST({func}, {upper})"
         self.apply(func=func)
         return self._parent
 
@@ -535,6 +528,7 @@ class vDCFill(vDCMath):
         threshold: PythonNumber = 4.0,
         use_threshold: bool = True,
         alpha: PythonNumber = 0.05,
+        approx: bool = False,
     ) -> "vDataFrame":
         """
         Fills the vDataColumns outliers using the input method.
@@ -564,6 +558,10 @@ class vDCFill(vDCMath):
         alpha: PythonNumber, optional
             Number representing the outliers threshold. Values less than
             quantile(alpha) or greater than quantile(1-alpha) are filled.
+        approx: bool, optional
+            If set to True, the quantiles are approximated, which avoids
+            sorting the entire column. Only used when 'use_threshold' is
+            set to False.
 
         Returns
         -------
@@ -653,23 +651,13 @@ class vDCFill(vDCMath):
             | ``vDataColumn.``:py:meth:`~verticapy.vDataColumn.fill_outliers` : Fill the outliers using the input method.
         """
         if use_threshold:
-            result = self.aggregate(func=["std", "avg"]).transpose().values
-            p_alpha, p_1_alpha = (
-                -threshold * result["std"][0] + result["avg"][0],
-                threshold * result["std"][0] + result["avg"][0],
-            )
+            std, avg = self.aggregate(func=["std", "avg"]).values[self._alias]
+            p_alpha, p_1_alpha = avg - threshold * std, avg + threshold * std
         else:
-            query = f"""
-                SELECT /*+LABEL('vDataColumn.fill_outliers')*/ 
-                    PERCENTILE_CONT({alpha}) WITHIN GROUP (ORDER BY {self}) OVER (), 
-                    PERCENTILE_CONT(1 - {alpha}) WITHIN GROUP (ORDER BY {self}) OVER () 
-                FROM {self._parent} LIMIT 1"""
-            p_alpha, p_1_alpha = _executeSQL(
-                query=query,
-                title=f"Computing the quantiles of {self}.",
-                method="fetchrow",
-                sql_push_ext=self._parent._vars["sql_push_ext"],
-                symbol=self._parent._vars["symbol"],
+            p_alpha, p_1_alpha = (
+                self._parent.quantile([alpha, 1 - alpha], [self._alias], approx=approx)
+                .transpose()
+                .values[self._alias]
             )
         if method == "winsorize":
             self.clip(lower=p_alpha, upper=p_1_alpha)
@@ -679,27 +667,19 @@ class vDCFill(vDCMath):
             )
         elif method == "mean":
             query = f"""
-                WITH vdf_table AS 
-                    (SELECT 
-                        /*+LABEL('vDataColumn.fill_outliers')*/ * 
-                    FROM {self._parent}) 
-                    (SELECT 
-                        AVG({self}) 
-                    FROM vdf_table WHERE {self} < {p_alpha}) 
-                    UNION ALL 
-                    (SELECT 
-                        AVG({self}) 
-                    FROM vdf_table WHERE {self} > {p_1_alpha})"""
-            mean_alpha, mean_1_alpha = [
-                item[0]
-                for item in _executeSQL(
-                    query=query,
-                    title=f"Computing the average of the {self}'s lower and upper outliers.",
-                    method="fetchall",
-                    sql_push_ext=self._parent._vars["sql_push_ext"],
-                    symbol=self._parent._vars["symbol"],
-                )
-            ]
+                SELECT 
+                    /*+LABEL('vDataColumn.fill_outliers')*/ 
+                    AVG(CASE WHEN {self} < {p_alpha} THEN {self} END), 
+                    AVG(CASE WHEN {self} > {p_1_alpha} THEN {self} END), 
+                    AVG({self}) 
+                FROM {self._parent}"""
+            mean_alpha, mean_1_alpha, avg = _executeSQL(
+                query=query,
+                title=f"Computing the average of the {self}'s lower and upper outliers.",
+                method="fetchrow",
+                sql_push_ext=self._parent._vars["sql_push_ext"],
+                symbol=self._parent._vars["symbol"],
+            )
             if isinstance(mean_alpha, NoneType):
                 mean_alpha = "NULL"
             if isinstance(mean_1_alpha, NoneType):
@@ -714,6 +694,10 @@ class vDCFill(vDCMath):
                         ELSE {{}} 
                     END)"""
             )
+            # Replacing each tail by its own average keeps the sum
+            # and the count of the vDataColumn: its average is the
+            # same as before the transformation.
+            self._parent._update_catalog({"index": ["avg"], self._alias: [avg]})
         return self._parent
 
     @save_verticapy_logs
@@ -871,9 +855,13 @@ class vDCFill(vDCMath):
         method = method.lower()
         by, order_by = format_type(by, order_by, dtype=list)
         by, order_by = self._parent.format_colnames(by, order_by)
+        total, parent_cnt = self.count(), self._parent.shape()[0]
+        if total == parent_cnt:
+            if conf.get_option("print_info"):
+                print("Nothing was filled.")
+            return self._parent
         if method == "auto":
             method = "mean" if (self.isnum() and self.nunique(True) > 6) else "mode"
-        total = self.count()
         if (method == "mode") and isinstance(val, NoneType):
             val = self.mode(dropna=True)
             if isinstance(val, NoneType):
@@ -903,11 +891,12 @@ class vDCFill(vDCMath):
                 try:
                     if fun == "MEDIAN":
                         fun = "APPROXIMATE_MEDIAN"
+                    relation = self._parent._genSQL()
                     query = f"""
                         SELECT 
                             /*+LABEL('vDataColumn.fillna')*/ {by[0]}, 
                             {fun}({self})
-                        FROM {self._parent} 
+                        FROM {relation} 
                         GROUP BY {by[0]};"""
                     result = _executeSQL(
                         query=query,
@@ -916,23 +905,22 @@ class vDCFill(vDCMath):
                         sql_push_ext=self._parent._vars["sql_push_ext"],
                         symbol=self._parent._vars["symbol"],
                     )
-                    for idx, x in enumerate(result):
-                        if isinstance(x[0], NoneType):
-                            result[idx][0] = "NULL"
+                    decode_args = []
+                    for key, agg in result:
+                        if isinstance(key, NoneType):
+                            key = "NULL"
                         else:
-                            x0 = str(x[0]).replace("'", "''")
-                            result[idx][0] = f"'{x0}'"
-                        result[idx][1] = (
-                            "NULL" if isinstance(x[1], NoneType) else str(x[1])
-                        )
-                    val = ", ".join([f"{x[0]}, {x[1]}" for x in result])
+                            key = "'" + str(key).replace("'", "''") + "'"
+                        agg = "NULL" if isinstance(agg, NoneType) else str(agg)
+                        decode_args += [key, agg]
+                    val = ", ".join(decode_args)
                     new_column = f"COALESCE({{}}, DECODE({by[0]}, {val}, NULL))"
                     _executeSQL(
                         query=f"""
                             SELECT 
                                 /*+LABEL('vDataColumn.fillna')*/ 
                                 {new_column.format(self._alias)} 
-                            FROM {self._parent} 
+                            FROM {relation} 
                             LIMIT 1""",
                         print_time_sql=False,
                         sql_push_ext=self._parent._vars["sql_push_ext"],
@@ -953,7 +941,7 @@ class vDCFill(vDCMath):
             )
             desc = "" if (method in ("ffill", "pad")) else " DESC"
             partition_by = f"PARTITION BY {', '.join(by)}" if by else ""
-            order_by_ts = ", ".join([quote_ident(column) + desc for column in order_by])
+            order_by_ts = f"{desc}, ".join(quote_ident(order_by)) + desc
             new_column = f"""
                 COALESCE({{}}, LAST_VALUE({{}} IGNORE NULLS) 
                     OVER ({partition_by} 
@@ -964,29 +952,30 @@ class vDCFill(vDCMath):
             category, ctype = "int", "bool"
         else:
             category, ctype = self.category(), self.ctype()
-        copy_trans = copy.deepcopy(self._transf)
-        total = self.count()
+        copy_trans = list(self._transf)
         if method not in ["mode", "0ifnull"]:
-            max_floor = 0
             all_partition = by
             if method in ["ffill", "pad", "bfill", "backfill"]:
-                all_partition += list(order_by)
-            for elem in all_partition:
-                if len(self._parent[elem]._transf) > max_floor:
-                    max_floor = len(self._parent[elem]._transf)
+                all_partition = itertools.chain(by, order_by)
+            # The names are already formatted, the vDataColumns can
+            # be accessed directly without normalizing them again.
+            max_floor = max(
+                (len(getattr(self._parent, elem)._transf) for elem in all_partition),
+                default=0,
+            )
             max_floor -= len(self._transf)
             self._transf += [("{}", self.ctype(), self.category())] * max_floor
         self._transf += [(new_column, ctype, category)]
         try:
-            sauv = copy.deepcopy(self._catalog)
+            # _update_catalog rebinds the catalog, the old one stays intact.
+            sauv = self._catalog
             self._parent._update_catalog(erase=True, columns=[self._alias])
             total = abs(self.count() - total)
         except Exception as e:
-            self._transf = copy.deepcopy(copy_trans)
+            self._transf = copy_trans
             raise vQueryError(f"{e}\nAn Error happened during the filling.")
         if total > 0:
             if "count" in sauv:
-                parent_cnt = self._parent.shape()[0]
                 self._catalog["count"] = int(sauv["count"]) + total
                 if parent_cnt == 0:
                     self._catalog["percent"] = 100
@@ -1004,7 +993,6 @@ class vDCFill(vDCMath):
         else:
             if conf.get_option("print_info"):
                 print("Nothing was filled.")
-            self._transf = [t for t in copy_trans]
-            for s in sauv:
-                self._catalog[s] = sauv[s]
+            self._transf = copy_trans
+            self._catalog.update(sauv)
         return self._parent
@@ -14,7 +14,6 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
-import copy
 import random
 import warnings
 from typing import Literal, Optional, Union, TYPE_CHECKING
@@ -1163,7 +1162,7 @@ class vDFFilter(vDFAgg):
                 print("Nothing was filtered.")
         else:
             max_pos = 0
-            columns_tmp = copy.deepcopy(self._vars["columns"])
+            columns_tmp = list(self._vars["columns"])
             for column in columns_tmp:
                 max_pos = max(max_pos, len(self[column]._transf) - 1)
             new_count = self.shape()[0]
@@ -2057,18 +2056,25 @@ class vDCFilter(vDCAgg):
         """
         try:
             parent = self._parent
-            force_columns = copy.deepcopy(self._parent._vars["columns"])
+            force_columns = list(self._parent._vars["columns"])
             force_columns.remove(self._alias)
-            _executeSQL(
-                query=f"""
-                    SELECT 
-                        /*+LABEL('vDataColumn.drop')*/ * 
-                    FROM {self._parent._genSQL(force_columns=force_columns)} 
-                    LIMIT 10""",
-                print_time_sql=False,
-                sql_push_ext=self._parent._vars["sql_push_ext"],
-                symbol=self._parent._vars["symbol"],
-            )
+            # The relation is only checked when the column might be used
+            # by another column, a filter or a sort.
+            alias_str = self._alias.replace('"', "").lower()
+            exprs = [t[0] for c in force_columns for t in self._parent[c]._transf]
+            exprs += [str(w[0]) for w in self._parent._vars["where"]]
+            exprs += [str(o) for o in self._parent._vars["order_by"].values()]
+            if any(alias_str in e.lower() for e in exprs):
+                _executeSQL(
+                    query=f"""
+                        SELECT 
+                            /*+LABEL('vDataColumn.drop')*/ * 
+                        FROM {self._parent._genSQL(force_columns=force_columns)} 
+                        LIMIT 0""",
+                    print_time_sql=False,
+                    sql_push_ext=self._parent._vars["sql_push_ext"],
+                    symbol=self._parent._vars["symbol"],
+                )
             self._parent._vars["columns"].remove(self._alias)
             delattr(self._parent, self._alias)
         except QueryError:
@@ -2085,6 +2091,7 @@ class vDCFilter(vDCAgg):
         threshold: PythonNumber = 4.0,
         use_threshold: bool = True,
         alpha: PythonNumber = 0.05,
+        approx: bool = True,
     ) -> "vDataFrame":
         """
         Drops outliers in the vDataColumn.
@@ -2102,6 +2109,10 @@ class vDCFilter(vDCAgg):
             Number  representing  the outliers threshold.  Values
             less   than   quantile(alpha)   or   greater   than
             quantile(1-alpha) are be dropped.
+        approx: bool, optional
+            If  set to  True, the  quantiles are  approximated,
+            which  avoids  sorting  the  entire  column.  Only
+            used when 'use_threshold' is set to False.
 
         Returns
         -------
@@ -2186,15 +2197,11 @@ class vDCFilter(vDCAgg):
             | ``vDataFrame.``:py:meth:`~verticapy.vDataFrame.drop_duplicates` : Drops the vDataFrame duplicates.
         """
         if use_threshold:
-            result = self.aggregate(func=["std", "avg"]).transpose().values
-            self._parent.filter(
-                f"""
-                    ABS({self} - {result["avg"][0]}) 
-                  / {result["std"][0]} < {threshold}"""
-            )
+            std, avg = self.aggregate(func=["std", "avg"]).values[self._alias]
+            self._parent.filter(f"ABS({self} - {avg}) / {std} < {threshold}")
         else:
             p_alpha, p_1_alpha = (
-                self._parent.quantile([alpha, 1 - alpha], [self._alias])
+                self._parent.quantile([alpha, 1 - alpha], [self._alias], approx=approx)
                 .transpose()
                 .values[self._alias]
             )
@@ -649,6 +649,7 @@ class vDFInOut(vDFSystem):
                 sql_push_ext=self._vars["sql_push_ext"],
                 symbol=self._vars["symbol"],
             )
+            csv_rows = [csv_file]
             for row in result:
                 tmp_row = []
                 for item in row:
@@ -662,7 +663,8 @@ class vDFInOut(vDFSystem):
                         tmp_row += ["" if isinstance(na_rep, NoneType) else na_rep]
                     else:
                         tmp_row += [str(item)]
-                csv_file += "\n" + sep.join(tmp_row)
+                csv_rows += [sep.join(tmp_row)]
+            csv_file = "\n".join(csv_rows)
             current_nb_rows_written += limit
             file_id += 1
             if n_files == 1 and path:
@@ -1370,7 +1372,7 @@ class vDFInOut(vDFSystem):
         if not path:
             json_files = []
         while current_nb_rows_written < total:
-            json_file = "[\n"
+            json_rows = ["[\n"]
             result = _executeSQL(
                 query=f"""
                     SELECT 
@@ -1394,7 +1396,8 @@ class vDFInOut(vDFSystem):
                         tmp_row += [f"{quote_ident(columns[i])}: {item}"]
                     elif not isinstance(item, NoneType):
                         tmp_row += [f'{quote_ident(columns[i])}: "{item}"']
-                json_file += "{" + ", ".join(tmp_row) + "},\n"
+                json_rows += ["{" + ", ".join(tmp_row) + "},\n"]
+            json_file = "".join(json_rows)
             current_nb_rows_written += limit
             file_id += 1
             json_file = json_file[0:-2] + "\n]"
@@ -20,7 +20,7 @@ import re
 from typing import Literal, Optional, Union, TYPE_CHECKING
 
 import verticapy._config.config as conf
-from verticapy._typing import PythonNumber, PythonScalar, SQLColumns
+from verticapy._typing import NoneType, PythonNumber, PythonScalar, SQLColumns
 from verticapy._utils._gen import gen_name
 from verticapy._utils._map import verticapy_agg_name
 from verticapy._utils._object import create_new_vdf
@@ -38,6 +38,101 @@ from verticapy.sql.dtypes import get_data_types
 if TYPE_CHECKING:
     from verticapy.core.vdataframe.base import vDataFrame, vDataColumn
 
+"""
+Output types of the usual functions applied to numerical
+or text columns, keyed by input type ("text" for any text
+column). They avoid a type-probe query in vDataColumn.apply.
+"""
+
+_APPLY_FUN_PATTERN = re.compile(r"([A-Z_]+)\(\{\}(?:, (?:'(?:[^'{}]|'')*'|[\w.-]+))*\)")
+
+_FLOAT_FUN_TYPES = {"int": "float", "float": "float"}
+
+_APPLY_FUN_TYPES = {
+    "ABS": {"int": "int", "float": "float"},
+    "CEIL": {"float": "float"},
+    "CEILING": {"float": "float"},
+    "FLOOR": {"float": "float"},
+    "ROUND": {"float": "float"},
+    "TRUNC": {"float": "float"},
+    "LENGTH": {"text": "int"},
+    "REGEXP_COUNT": {"text": "int"},
+    **{
+        fun: _FLOAT_FUN_TYPES
+        for fun in (
+            "ACOS",
+            "ASIN",
+            "ATAN",
+            "CBRT",
+            "COS",
+            "COSH",
+            "COT",
+            "DEGREES",
+            "EXP",
+            "LN",
+            "RADIANS",
+            "SIN",
+            "SINH",
+            "SQRT",
+            "TAN",
+            "TANH",
+        )
+    },
+}
+
+"""
+Functions taking the column as first argument followed by
+constants only (ROUND, SUBSTR, REGEXP_COUNT, ...). They can
+be fused with the previous transformation of the column.
+"""
+
+_WRAP_FUN_PATTERN = re.compile(
+    r"[A-Z_]+\(\{\}(?:, (?:'(?:[^'{}]|'')*'|-?\d+(?:\.\d+)?))*\)(?: > 0)?"
+)
+
+"""
+SQL templates used by vDataColumn.apply_fun. Functions
+depending on the column category (len, contain, find)
+are resolved at call time.
+"""
+
+_APPLY_FUN_SQL = {
+    **{
+        fun: f"{fun.upper()}({{}})"
+        for fun in (
+            "abs",
+            "acos",
+            "asin",
+            "atan",
+            "cbrt",
+            "ceil",
+            "cos",
+            "cosh",
+            "cot",
+            "exp",
+            "floor",
+            "ln",
+            "log10",
+            "sign",
+            "sin",
+            "sinh",
+            "sqrt",
+            "tan",
+            "tanh",
+        )
+    },
+    **{
+        fun: f"APPLY_{fun.upper()}({{}})"
+        for fun in ("avg", "count", "max", "min", "sum")
+    },
+    "mean": "APPLY_AVG({})",
+    "dim": "ARRAY_DIMS({})",
+    "log": "LOG({x}, {{}})",
+    "mod": "MOD({{}}, {x})",
+    "pow": "POW({{}}, {x})",
+    "round": "ROUND({{}}, {x})",
+}
+
 
 class vDFMath(vDFFilter):
     def __abs__(self) -> "vDataFrame":
@@ -1216,30 +1311,26 @@ class vDCMath(vDCFilter):
         func_apply = func.replace("{}", self._alias)
         alias_sql_repr = self._alias.replace('"', "")
         try:
-            ctype = get_data_types(
-                expr=f"""
-                    SELECT 
-                        {func_apply} AS apply_test_feature 
-                    FROM {self._parent} 
-                    WHERE {self} IS NOT NULL 
-                    LIMIT 0""",
-                column="apply_test_feature",
-            )
+            ctype = None
+            match = _APPLY_FUN_PATTERN.fullmatch(func)
+            if match:
+                fun_types = _APPLY_FUN_TYPES.get(match.group(1), {})
+                ctype = fun_types.get(self.ctype())
+                if isinstance(ctype, NoneType) and self.category() == "text":
+                    # Text functions do not depend on the varchar length.
+                    ctype = fun_types.get("text")
+            if isinstance(ctype, NoneType):
+                ctype = get_data_types(
+                    expr=f"""
+                        SELECT 
+                            {func_apply} AS apply_test_feature 
+                        FROM {self._parent} 
+                        WHERE {self} IS NOT NULL 
+                        LIMIT 0""",
+                    column="apply_test_feature",
+                )
             category = to_category(ctype=ctype)
-            all_cols, max_floor = self._parent.get_columns(), 0
-            for column in all_cols:
-                try:
-                    column_str = column.replace('"', "")
-                    if (quote_ident(column) in func) or (
-                        re.search(
-                            re.compile(f"\\b{column_str}\\b"),
-                            func,
-                        )
-                    ):
-                        max_floor = max(len(self._parent[column]._transf), max_floor)
-                except:
-                    pass
-            max_floor -= len(self._transf)
+            max_floor = self._parent._get_max_floor(func) - len(self._transf)
             if copy_name:
                 copy_name_str = copy_name.replace('"', "")
                 self.add_copy(name=copy_name_str)
@@ -1249,9 +1340,24 @@ class vDCMath(vDCFilter):
                 self._parent[copy_name_str]._transf += [(func, ctype, category)]
                 self._parent[copy_name_str]._catalog = self._catalog
             else:
-                for k in range(max_floor):
-                    self._transf += [("{}", self.ctype(), self.category())]
-                self._transf += [(func, ctype, category)]
+                last_pos = len(self._transf) - 1
+                if max_floor > 0:
+                    self._transf += [("{}", self.ctype(), self.category())] * max_floor
+                    self._transf += [(func, ctype, category)]
+                elif (
+                    last_pos > 0
+                    and _WRAP_FUN_PATTERN.fullmatch(func)
+                    and self._parent._is_top_floor(last_pos)
+                ):
+                    # The function only wraps the column: it is fused with
+                    # the last transformation to avoid a new subquery.
+                    self._transf[-1] = (
+                        func.replace("{}", self._transf[-1][0]),
+                        ctype,
+                        category,
+                    )
+                else:
+                    self._transf += [(func, ctype, category)]
                 self._parent._update_catalog(erase=True, columns=[self._alias])
             self._parent._add_to_history(
                 f"[Apply]: The vDataColumn '{alias_sql_repr}' was "
@@ -1465,39 +1571,28 @@ class vDCMath(vDCFilter):
             | ``vDataColumn.``:py:meth:`~verticapy.vDataColumn.apply` :
                 Applies a function to the :py:class:`~vDataColumn`.
         """
-        if func == "mean":
-            func = "avg"
-        elif func == "length":
-            func = "len"
-        cat = self.category()
-        if func == "len":
+        if tmpl := _APPLY_FUN_SQL.get(func):
+            expr = tmpl.format(x=x) if "{x}" in tmpl else tmpl
+        elif func in ("len", "length"):
+            cat = self.category()
             if cat == "vmap":
-                func = "MAPSIZE"
+                expr = "MAPSIZE({})"
             elif cat == "complex":
-                func = "APPLY_COUNT_ELEMENTS"
+                expr = "APPLY_COUNT_ELEMENTS({})"
             else:
-                func = "LENTGH"
-        elif func in ("max", "min", "sum", "avg", "count"):
-            func = "APPLY_" + func
-        elif func == "dim":
-            func = "ARRAY_DIMS"
-        if func not in ("log", "mod", "pow", "round", "contain", "find"):
-            expr = f"{func.upper()}({{}})"
-        elif func in ("log",):
-            expr = f"{func.upper()}({x}, {{}})"
-        elif func in ("mod", "pow", "round"):
-            expr = f"{func.upper()}({{}}, {x})"
+                expr = "LENGTH({})"
         elif func in ("contain", "find"):
-            if func == "contain":
-                if cat == "vmap":
-                    f = "MAPCONTAINSVALUE"
-                else:
-                    f = "CONTAINS"
-            elif func == "find":
+            if func == "find":
                 f = "ARRAY_FIND"
+            elif self.category() == "vmap":
+                f = "MAPCONTAINSVALUE"
+            else:
+                f = "CONTAINS"
             if isinstance(x, str):
                 x = "'" + str(x).replace("'", "''") + "'"
             expr = f"{f}({{}}, {x})"
+        else:
+            expr = f"{func.upper()}({{}})"
         return self.apply(func=expr)
 
     @save_verticapy_logs
@@ -1899,6 +1994,9 @@ class vDCMath(vDCFilter):
             | ``vDataFrame.``:py:meth:`~verticapy.vDataFrame.abs` : Get the
                 absolute value of mutiple :py:class:`~vDataColumn`.
         """
+        if n >= 0 and self.category() == "int":
+            # Rounding an integer to n >= 0 digits is a no-op.
+            return self._parent
         return self.apply(func=f"ROUND({{}}, {n})")
 
     @save_verticapy_logs
@@ -43,7 +43,7 @@ from verticapy.core.tablesample.base import TableSample
 from verticapy.core.vdataframe._machine_learning import vDFMachineLearning
 from verticapy.core.vdataframe._scaler import vDCScaler
 
-from verticapy.plotting.base import PlottingBase
+from verticapy.plotting.base import PlottingBase, _optimal_bar_width
 
 
 class vDFPlot(vDFMachineLearning):
@@ -2748,27 +2748,23 @@ class vDCPlot(vDCScaler):
             "numh is only available on type numeric|date"
         )
         if self.isnum():
-            result = (
-                self._parent.describe(
-                    method="numerical", columns=[self._alias], unique=False
-                )
-                .transpose()
-                .values[self._alias]
-            )
+            # Only the needed statistics are computed, the ones
+            # already in the catalog are not queried again.
             (
                 count,
                 vDataColumn_min,
                 vDataColumn_025,
                 vDataColumn_075,
                 vDataColumn_max,
-            ) = (
-                result[0],
-                result[3],
-                result[4],
-                result[6],
-                result[7],
-            )
+            ) = self.aggregate(
+                ["count", "min", "approx_25%", "approx_75%", "max"]
+            ).values[
+                self._alias
+            ]
         elif self.isdate():
+            # Both bandwidths only depend on differences between the
+            # statistics: any fixed origin can be used to convert the
+            # dates, there is no need to compute the minimum first.
             result = _executeSQL(
                 f"""
                 SELECT 
@@ -2782,7 +2778,7 @@ class vDCPlot(vDCScaler):
                 FROM 
                     (SELECT 
                         DATEDIFF('second', 
-                                 '{self.min()}'::timestamp, 
+                                 '1970-01-01'::timestamp, 
                                  {self}) AS {self} 
                     FROM {self._parent}) VERTICAPY_OPTIMAL_H_TABLE""",
                 title="Different aggregations to compute the optimal h.",
@@ -2797,13 +2793,8 @@ class vDCPlot(vDCScaler):
                 vDataColumn_075,
                 vDataColumn_max,
             ) = result
-        sturges = max(
-            float(vDataColumn_max - vDataColumn_min)
-            / int(math.floor(math.log(count, 2) + 2)),
-            1e-99,
-        )
-        fd = max(
-            2.0 * (vDataColumn_075 - vDataColumn_025) / (count) ** (1.0 / 3.0), 1e-99
+        sturges, fd = _optimal_bar_width(
+            count, vDataColumn_min, vDataColumn_025, vDataColumn_075, vDataColumn_max
         )
         if method.lower() == "sturges":
             best_h = sturges
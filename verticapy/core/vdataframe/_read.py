@@ -760,6 +760,9 @@ class vDFRead(vDFUtils):
 
 
 class vDCRead:
+    # Number of rows fetched at once when indexing.
+    _row_chunk: int = 1024
+
     def __init__(self):
         """Must be overridden in final class"""
         self._parent = create_new_vdf(_empty=True)
@@ -768,6 +771,8 @@ class vDCRead:
         self._catalog = {}
         self._init_transf = ""
         self._init = False
+        self._row_cache = (None, 0, [])
+        self._head_cache = (None, None)
 
     def __getitem__(self, index) -> Any:
         if isinstance(index, slice):
@@ -846,20 +851,35 @@ class vDCRead:
                 cast = "::float" if self.category() == "float" else ""
                 if index < 0:
                     index += self._parent.shape()[0]
-                return _executeSQL(
-                    query=f"""
-                        SELECT 
-                            /*+LABEL('vDataColumn.__getitem__')*/ 
-                            {self}{cast} 
-                        FROM {self._parent}
-                        {self._parent._get_last_order_by()} 
-                        OFFSET {index} 
-                        LIMIT 1""",
-                    title="Getting the vDataColumn element.",
-                    method="fetchfirstelem",
-                    sql_push_ext=self._parent._vars["sql_push_ext"],
-                    symbol=self._parent._vars["symbol"],
-                )
+                query = f"""
+                    SELECT 
+                        /*+LABEL('vDataColumn.__getitem__')*/ 
+                        {self}{cast} 
+                    FROM {self._parent}
+                    {self._parent._get_last_order_by()}"""
+                if not conf.get_option("cache"):
+                    return _executeSQL(
+                        query=f"{query} OFFSET {index} LIMIT 1",
+                        title="Getting the vDataColumn element.",
+                        method="fetchfirstelem",
+                        sql_push_ext=self._parent._vars["sql_push_ext"],
+                        symbol=self._parent._vars["symbol"],
+                    )
+                # The rows are fetched by chunks to avoid one query
+                # per element when iterating.
+                query_cache, offset, rows = self._row_cache
+                if query_cache != query or not 0 <= index - offset < len(rows):
+                    offset = index
+                    rows = _executeSQL(
+                        query=f"{query} OFFSET {index} LIMIT {self._row_chunk}",
+                        title="Getting the vDataColumn elements.",
+                        method="fetchall",
+                        sql_push_ext=self._parent._vars["sql_push_ext"],
+                        symbol=self._parent._vars["symbol"],
+                    )
+                    rows = [row[0] for row in rows]
+                    self._row_cache = (query, offset, rows)
+                return rows[index - offset]
         elif isinstance(index, str):
             if self.category() == "vmap":
                 index_str = index.replace("'", "''")
@@ -880,10 +900,32 @@ class vDCRead:
             return getattr(self, index)
 
     def __repr__(self) -> str:
-        return self.head(limit=conf.get_option("max_rows")).__repr__()
+        return self._display_head().__repr__()
 
     def _repr_html_(self) -> str:
-        return self.head(limit=conf.get_option("max_rows"))._repr_html_()
+        return self._display_head()._repr_html_()
+
+    def _display_head(self) -> TableSample:
+        """
+        Returns the head used to display the vDataColumn.
+        Notebooks call both __repr__ and _repr_html_, the
+        result is then reused while the relation does not
+        change.
+        """
+        limit = conf.get_option("max_rows")
+        if not conf.get_option("cache"):
+            return self.head(limit=limit)
+        key = (
+            limit,
+            self._alias,
+            self._parent._genSQL(),
+            self._parent._get_last_order_by(),
+        )
+        key_cache, res = self._head_cache
+        if key_cache != key:
+            res = self.head(limit=limit)
+            self._head_cache = (key, res)
+        return res
 
     def head(self, limit: int = 5) -> TableSample:
         """
@@ -14,8 +14,8 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
-import copy
 import math
+import re
 import warnings
 from typing import Literal, Optional, TYPE_CHECKING
 
@@ -32,6 +32,16 @@ from verticapy.core.vdataframe._text import vDFText, vDCText
 if TYPE_CHECKING:
     from verticapy.core.vdataframe.base import vDataFrame
 
+"""
+Catalog statistics of a vDataColumn after a global affine
+transformation x -> (x - loc) / scale, with scale > 0.
+"""
+
+_AFFINE_INVARIANT_STATS = ("approx_unique", "kurtosis", "skewness", "unique")
+_AFFINE_LOCATION_STATS = ("avg", "max", "min")
+_AFFINE_SCALE_STATS = ("aad", "mad", "std")
+_PERCENTILE_KEY = re.compile(r"(?:approx_)?[\d.]+%")
+
 
 class vDFScaler(vDFText):
     @save_verticapy_logs
@@ -186,9 +196,11 @@ class vDFScaler(vDFText):
         no_cols = len(columns) == 0
         columns = self.numcol() if not columns else self.format_colnames(columns)
         for column in columns:
-            if self[column].isnum() and not self[column].isbool():
-                self[column].scale(method=method)
-            elif (no_cols) and (self[column].isbool()):
+            vdc = self[column]
+            is_bool = vdc.isbool()
+            if not is_bool and (no_cols or vdc.isnum()):
+                vdc.scale(method=method)
+            elif (no_cols) and (is_bool):
                 pass
             elif conf.get_option("print_info"):
                 warning_message = (
@@ -202,6 +214,69 @@ class vDFScaler(vDFText):
 
 
 class vDCScaler(vDCText):
+    def _scale_stats(self, func: list) -> list:
+        """
+        Returns the input aggregations of the vDataColumn,
+        reading them from the catalog when they were all
+        already computed to avoid a round trip.
+        """
+        res = [self._parent._get_catalog_value(self._alias, fun) for fun in func]
+        if "VERTICAPY_NOT_PRECOMPUTED" in res:
+            return self.aggregate(func).values[self._alias]
+        return res
+
+    def _categorical_scale_sql(self, by: str, aggregates: tuple) -> tuple:
+        """
+        Computes the two input aggregations for each
+        category of the vDataColumn 'by' and returns
+        the corresponding DECODE expressions. Falls
+        back to analytic functions partitioned by
+        'by' if the expressions are not valid.
+        """
+        fallback = tuple(
+            f"{agg}({self}) OVER (PARTITION BY {by})" for agg in aggregates
+        )
+        parent_sql = self._parent._genSQL()
+        parent_vars = self._parent._vars
+        try:
+            result = _executeSQL(
+                query=f"""
+                    SELECT 
+                        /*+LABEL('vDataColumn.scale')*/ 
+                        {by}, 
+                        {aggregates[0]}({self}), 
+                        {aggregates[1]}({self}) 
+                    FROM {parent_sql} 
+                    GROUP BY {by}""",
+                title=f"Computing the different categories {by} to scale.",
+                method="fetchall",
+                sql_push_ext=parent_vars["sql_push_ext"],
+                symbol=parent_vars["symbol"],
+            )
+        except QueryError:
+            return fallback
+
+        def _clean(v):
+            if v is None or (isinstance(v, float) and math.isnan(v)):
+                return None
+            return v
+
+        # Both DECODE argument lists are built in a single pass,
+        # escaping each category once.
+        decode_args = ([], [])
+        for x in result:
+            if isinstance(x[0], NoneType):
+                key = "NULL"
+            else:
+                key = "'" + str(x[0]).replace("'", "''") + "'"
+            for args, val in zip(decode_args, (_clean(x[1]), _clean(x[2]))):
+                if val is not None:
+                    args += [key, str(val)]
+        if not (decode_args[0] and decode_args[1]):
+            # An empty DECODE is not valid SQL.
+            return fallback
+        return tuple(f"DECODE({by}, {', '.join(args)}, NULL)" for args in decode_args)
+
     @save_verticapy_logs
     def scale(
         self,
@@ -362,7 +437,7 @@ class vDCScaler(vDCText):
             if method == "zscore":
                 if n == 0:
                     nullifzero = 0
-                    avg, stddev = self.aggregate(["avg", "std"]).values[self._alias]
+                    avg, stddev = self._scale_stats(["avg", "std"])
                     if stddev == 0:
                         warning_message = (
                             f"Can not scale {self} using a "
@@ -371,76 +446,7 @@ class vDCScaler(vDCText):
                         warnings.warn(warning_message, Warning)
                         return self
                 elif (n == 1) and (self._parent[by[0]].nunique() < 50):
-                    try:
-                        result = _executeSQL(
-                            query=f"""
-                                SELECT 
-                                    /*+LABEL('vDataColumn.scale')*/ 
-                                    {by[0]}, 
-                                    AVG({self}), 
-                                    STDDEV({self}) 
-                                FROM {self._parent} GROUP BY {by[0]}""",
-                            title="Computing the different categories to scale.",
-                            method="fetchall",
-                            sql_push_ext=self._parent._vars["sql_push_ext"],
-                            symbol=self._parent._vars["symbol"],
-                        )
-                        for i in range(len(result)):
-                            if not isinstance(result[i][2], NoneType) and math.isnan(
-                                result[i][2]
-                            ):
-                                result[i][2] = None
-                        avg = "DECODE({}, {}, NULL)".format(
-                            by[0],
-                            ", ".join(
-                                [
-                                    "{}, {}".format(
-                                        "'{}'".format(str(x[0]).replace("'", "''"))
-                                        if not isinstance(x[0], NoneType)
-                                        else "NULL",
-                                        x[1]
-                                        if not isinstance(x[1], NoneType)
-                                        else "NULL",
-                                    )
-                                    for x in result
-                                    if not isinstance(x[1], NoneType)
-                                ]
-                            ),
-                        )
-                        stddev = "DECODE({}, {}, NULL)".format(
-                            by[0],
-                            ", ".join(
-                                [
-                                    "{}, {}".format(
-                                        "'{}'".format(str(x[0]).replace("'", "''"))
-                                        if not isinstance(x[0], NoneType)
-                                        else "NULL",
-                                        x[2]
-                                        if not isinstance(x[2], NoneType)
-                                        else "NULL",
-                                    )
-                                    for x in result
-                                    if not isinstance(x[2], NoneType)
-                                ]
-                            ),
-                        )
-                        _executeSQL(
-                            query=f"""
-                                SELECT 
-                                    /*+LABEL('vDataColumn.scale')*/ 
-                                    {avg},
-                                    {stddev} 
-                                FROM {self._parent} 
-                                LIMIT 1""",
-                            print_time_sql=False,
-                            sql_push_ext=self._parent._vars["sql_push_ext"],
-                            symbol=self._parent._vars["symbol"],
-                        )
-                    except QueryError:
-                        avg, stddev = (
-                            f"AVG({self}) OVER (PARTITION BY {', '.join(by)})",
-                            f"STDDEV({self}) OVER (PARTITION BY {', '.join(by)})",
-                        )
+                    avg, stddev = self._categorical_scale_sql(by[0], ("AVG", "STDDEV"))
                 else:
                     avg, stddev = (
                         f"AVG({self}) OVER (PARTITION BY {', '.join(by)})",
@@ -467,7 +473,7 @@ class vDCScaler(vDCText):
                     )
                     warnings.warn(warning_message, Warning)
                     return self
-                mad, med = self.aggregate(["mad", "approx_median"]).values[self._alias]
+                mad, med = self._scale_stats(["mad", "approx_median"])
                 mad *= 1.4826
                 if mad != 0:
                     if return_trans:
@@ -491,7 +497,7 @@ class vDCScaler(vDCText):
             elif method == "minmax":
                 if n == 0:
                     nullifzero = 0
-                    cmin, cmax = self.aggregate(["min", "max"]).values[self._alias]
+                    cmin, cmax = self._scale_stats(["min", "max"])
                     if cmax - cmin == 0:
                         warning_message = (
                             f"Can not scale {self} using "
@@ -499,73 +505,8 @@ class vDCScaler(vDCText):
                         )
                         warnings.warn(warning_message, Warning)
                         return self
-                elif n == 1:
-                    try:
-                        result = _executeSQL(
-                            query=f"""
-                                SELECT 
-                                    /*+LABEL('vDataColumn.scale')*/ 
-                                    {by[0]}, 
-                                    MIN({self}), 
-                                    MAX({self})
-                                FROM {self._parent} 
-                                GROUP BY {by[0]}""",
-                            title=f"Computing the different categories {by[0]} to scale.",
-                            method="fetchall",
-                            sql_push_ext=self._parent._vars["sql_push_ext"],
-                            symbol=self._parent._vars["symbol"],
-                        )
-                        cmin = "DECODE({}, {}, NULL)".format(
-                            by[0],
-                            ", ".join(
-                                [
-                                    "{}, {}".format(
-                                        "'{}'".format(str(x[0]).replace("'", "''"))
-                                        if not isinstance(x[0], NoneType)
-                                        else "NULL",
-                                        x[1]
-                                        if not isinstance(x[1], NoneType)
-                                        else "NULL",
-                                    )
-                                    for x in result
-                                    if not isinstance(x[1], NoneType)
-                                ]
-                            ),
-                        )
-                        cmax = "DECODE({}, {}, NULL)".format(
-                            by[0],
-                            ", ".join(
-                                [
-                                    "{}, {}".format(
-                                        "'{}'".format(str(x[0]).replace("'", "''"))
-                                        if not isinstance(x[0], NoneType)
-                                        else "NULL",
-                                        x[2]
-                                        if not isinstance(x[2], NoneType)
-                                        else "NULL",
-                                    )
-                                    for x in result
-                                    if not isinstance(x[2], NoneType)
-                                ]
-                            ),
-                        )
-                        _executeSQL(
-                            query=f"""
-                                SELECT 
-                                    /*+LABEL('vDataColumn.scale')*/ 
-                                    {cmax}, 
-                                    {cmin} 
-                                FROM {self._parent} 
-                                LIMIT 1""",
-                            print_time_sql=False,
-                            sql_push_ext=self._parent._vars["sql_push_ext"],
-                            symbol=self._parent._vars["symbol"],
-                        )
-                    except QueryError:
-                        cmax, cmin = (
-                            f"MAX({self}) OVER (PARTITION BY {', '.join(by)})",
-                            f"MIN({self}) OVER (PARTITION BY {', '.join(by)})",
-                        )
+                elif (n == 1) and (self._parent[by[0]].nunique() < 50):
+                    cmin, cmax = self._categorical_scale_sql(by[0], ("MIN", "MAX"))
                 else:
                     cmax, cmin = (
                         f"MAX({self}) OVER (PARTITION BY {', '.join(by)})",
@@ -583,49 +524,66 @@ class vDCScaler(vDCText):
                         )
                     ]
 
-            if method != "robust_zscore":
-                max_floor = 0
-                for elem in by:
-                    if len(self._parent[elem]._transf) > max_floor:
-                        max_floor = len(self._parent[elem]._transf)
+            if method != "robust_zscore" and by:
+                max_floor = max(len(getattr(self._parent, elem)._transf) for elem in by)
                 max_floor -= len(self._transf)
-                self._transf += [("{}", self.ctype(), self.category())] * max_floor
+                if max_floor > 0:
+                    self._transf.extend(
+                        [("{}", self.ctype(), self.category())] * max_floor
+                    )
             self._transf += final_transformation
-            sauv = copy.deepcopy(self._catalog)
+            sauv = self._catalog.copy()
             self._parent._update_catalog(erase=True, columns=[self._alias])
 
-            parent_cnt = self._parent.shape()[0]
-
             if "count" in sauv:
+                # The parent size is only needed to recompute the percent.
+                parent_cnt = self._parent.shape()[0]
                 self._catalog["count"] = sauv["count"]
                 if parent_cnt == 0:
                     self._catalog["percent"] = 100
                 else:
                     self._catalog["percent"] = 100 * sauv["count"] / parent_cnt
 
-            for elem in sauv:
+            # The most frequent values follow the same affine
+            # transformation, which is only global without 'by'.
+            loc, scale = None, None
+            if n == 0 and method == "robust_zscore":
+                loc, scale = sauv.get("approx_50%"), sauv.get("mad")
+                if not isinstance(scale, NoneType):
+                    scale *= 1.4826
+            elif n == 0 and method == "zscore":
+                loc, scale = sauv.get("avg"), sauv.get("std")
+            elif n == 0 and method == "minmax" and "max" in sauv and "min" in sauv:
+                loc, scale = sauv["min"], sauv["max"] - sauv["min"]
+            rescale = not isinstance(loc, NoneType) and bool(scale)
+            for elem, val in sauv.items():
+                if not isinstance(elem, str) or isinstance(val, dict):
+                    continue
                 if "top" in elem:
                     if "percent" in elem:
-                        self._catalog[elem] = sauv[elem]
-                    elif isinstance(elem, NoneType):
+                        self._catalog[elem] = val
+                    elif isinstance(val, NoneType):
                         self._catalog[elem] = None
-                    elif method == "robust_zscore":
-                        self._catalog[elem] = (sauv[elem] - sauv["approx_50%"]) / (
-                            1.4826 * sauv["mad"]
-                        )
-                    elif method == "zscore":
-                        self._catalog[elem] = (sauv[elem] - sauv["mean"]) / sauv["std"]
-                    elif method == "minmax":
-                        self._catalog[elem] = (sauv[elem] - sauv["min"]) / (
-                            sauv["max"] - sauv["min"]
-                        )
+                    elif rescale:
+                        self._catalog[elem] = (val - loc) / scale
+                elif not rescale or not isinstance(val, (int, float)):
+                    continue
+                elif elem in _AFFINE_INVARIANT_STATS:
+                    self._catalog[elem] = val
+                elif elem in _AFFINE_LOCATION_STATS or _PERCENTILE_KEY.fullmatch(elem):
+                    self._catalog[elem] = (val - loc) / scale
+                elif elem in _AFFINE_SCALE_STATS:
+                    self._catalog[elem] = val / scale
+                elif elem == "var":
+                    self._catalog[elem] = val / scale**2
 
             if method == "robust_zscore":
-                self._catalog["median"] = 0
+                self._catalog["approx_50%"] = 0
                 self._catalog["mad"] = 1 / 1.4826
             elif method == "zscore":
-                self._catalog["mean"] = 0
-                self._catalog["std"] = 1
+                self._catalog["avg"] = 0
+                if n == 0:
+                    self._catalog["std"] = 1
             elif method == "minmax":
                 self._catalog["min"] = 0
                 self._catalog["max"] = 1
@@ -15,9 +15,11 @@ See the  License for the specific  language governing
 permissions and limitations under the License.
 """
 import copy
+import re
 import sys
 import time
 import warnings
+from functools import lru_cache
 from typing import Any, Optional, Union, TYPE_CHECKING
 
 import verticapy._config.config as conf
@@ -38,6 +40,14 @@ if TYPE_CHECKING:
     from verticapy.core.vdataframe.base import vDataFrame
 
 
+@lru_cache(maxsize=4096)
+def _word_regex(word: str) -> re.Pattern:
+    """
+    Returns the compiled regex matching the input word.
+    """
+    return re.compile(f"\\b{re.escape(word)}\\b")
+
+
 class vDFSystem(vDFTyping):
     def __format__(self, format_spec: Any) -> str:
         return format(self._genSQL(), format_spec)
@@ -83,9 +93,9 @@ class vDFSystem(vDFTyping):
         all_imputations_grammar = []
         transformations = format_type(transformations, dtype=dict)
         force_columns = format_type(force_columns, dtype=list)
-        force_columns_copy = copy.deepcopy(force_columns)
+        force_columns_copy = list(force_columns)
         if len(force_columns) == 0:
-            force_columns = copy.deepcopy(self._vars["columns"])
+            force_columns = list(self._vars["columns"])
         for column in force_columns:
             all_imputations_grammar += [
                 [transformation[0] for transformation in self[column]._transf]
@@ -136,7 +146,10 @@ class vDFSystem(vDFTyping):
                 FROM {self._vars['main_relation']}"""
         else:
             table = f"""SELECT * FROM {self._vars["main_relation"]}"""
-        # We compute the other floors
+        # We compute the other floors. Each floor wraps the previous
+        # one: the heads and tails are collected and joined only once
+        # to avoid copying the whole relation at every floor.
+        heads, tails = [], []
         for i in range(1, max_transformation_floor):
             values = [item[i] for item in all_imputations_grammar]
             for j in range(0, len(values)):
@@ -145,11 +158,15 @@ class vDFSystem(vDFTyping):
                 elif values[j] != "___VERTICAPY_UNDEFINED___":
                     values_str = values[j].replace("{}", columns[j])
                     values[j] = f"{values_str} AS {columns[j]}"
-            table = f"SELECT {', '.join(values)} FROM ({table}) VERTICAPY_SUBTABLE"
+            heads += [f"SELECT {', '.join(values)} FROM ("]
+            tail = ") VERTICAPY_SUBTABLE"
             if len(all_where) > i - 1:
-                table += all_where[i - 1]
+                tail += all_where[i - 1]
             if (i - 1) in self._vars["order_by"]:
-                table += self._vars["order_by"][i - 1]
+                tail += self._vars["order_by"][i - 1]
+            tails += [tail]
+        if heads:
+            table = "".join(heads[::-1]) + table + "".join(tails)
         where_final = (
             all_where[max_transformation_floor - 1]
             if (len(all_where) > max_transformation_floor - 1)
@@ -238,13 +255,43 @@ class vDFSystem(vDFTyping):
         Returns the last column used to sort the data.
         """
         max_pos, order_by = 0, ""
-        columns_tmp = copy.deepcopy(self.get_columns())
+        columns_tmp = self.get_columns()
         for column in columns_tmp:
             max_pos = max(max_pos, len(self[column]._transf) - 1)
         if max_pos in self._vars["order_by"]:
             order_by = self._vars["order_by"][max_pos]
         return order_by
 
+    def _is_top_floor(self, pos: int) -> bool:
+        """
+        Returns True if no vDataColumn transformation, filter
+        or sort was applied after the input floor position.
+        """
+        for column in self._vars["columns"]:
+            if len(self[column]._transf) > pos + 1:
+                return False
+        for _, where_pos in self._vars["where"]:
+            if where_pos >= pos:
+                return False
+        for order_by_pos in self._vars["order_by"]:
+            if order_by_pos >= pos:
+                return False
+        return True
+
+    def _get_max_floor(self, expr: str) -> int:
+        """
+        Returns the maximum number of transformations of the
+        vDataColumns used in the input expression.
+        """
+        max_floor = 0
+        for column in self.get_columns():
+            column_str = column.replace('"', "")
+            if (quote_ident(column) in expr) or (
+                column_str in expr and _word_regex(column_str).search(expr)
+            ):
+                max_floor = max(len(self[column]._transf), max_floor)
+        return max_floor
+
     def _get_hash_syntax(self, columns: Union[dict, SQLColumns]) -> str:
         """
         Returns the SQL syntax used to segment using the input columns.
@@ -313,9 +360,11 @@ class vDFSystem(vDFTyping):
         if erase:
             if not columns:
                 columns = self.get_columns()
+                # Only the relation-wide erasures can change the
+                # number of rows.
+                self._vars["count"] = -1
             for column in columns:
                 self[column]._catalog = copy.deepcopy(agg_dict)
-            self._vars["count"] = -1
         elif matrix:
             matrix = verticapy_agg_name(matrix.lower())
             if matrix in agg_dict:
@@ -720,11 +769,8 @@ class vDFSystem(vDFTyping):
             values[column] = [expsize, values[column][0] * maxsize, ctype]
             total_expected += values[column][0]
             total += values[column][1]
-        values["separator"] = [
-            len(columns) * self.shape()[0] / div_unit,
-            len(columns) * self.shape()[0] / div_unit,
-            "",
-        ]
+        separator_size = len(columns) * self.shape()[0] / div_unit
+        values["separator"] = [separator_size, separator_size, ""]
         total += values["separator"][0]
         total_expected += values["separator"][0]
         values["header"] = [
@@ -1237,9 +1283,8 @@ class vDCSystem(vDCTyping):
             + sys.getsizeof(self._alias)
             + sys.getsizeof(self._transf)
             + sys.getsizeof(self._catalog)
+            + sum(map(sys.getsizeof, self._catalog))
         )
-        for elem in self._catalog:
-            total += sys.getsizeof(elem)
         return total
 
     @save_verticapy_logs
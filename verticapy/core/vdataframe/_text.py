@@ -14,6 +14,7 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
+import re
 from typing import Literal, Optional, TYPE_CHECKING
 
 from verticapy._utils._sql._collect import save_verticapy_logs
@@ -25,6 +26,25 @@ from verticapy.core.vdataframe._corr import vDCCorr
 if TYPE_CHECKING:
     from verticapy.core.vdataframe.base import vDataFrame
 
+"""
+Regular expression metacharacters. A pattern without any
+of them is a plain literal.
+"""
+
+_REGEX_META = re.compile(r"[.^$*+?()[\]{}|\\]")
+
+
+def _regexp_modifier(flags: Optional[str], defaults: str) -> str:
+    """
+    Returns the trailing arguments of a REGEXP_* function
+    setting the input modifiers. The defaults fill the
+    positional arguments preceding the modifier.
+    """
+    if not flags:
+        return ""
+    flags = flags.replace("'", "''")
+    return f", {defaults}, '{flags}'"
+
 
 class vDFText(vDFRolling):
     @save_verticapy_logs
@@ -229,7 +249,7 @@ class vDFText(vDFRolling):
 
 class vDCText(vDCCorr):
     @save_verticapy_logs
-    def str_contains(self, pat: str) -> "vDataFrame":
+    def str_contains(self, pat: str, flags: Optional[str] = None) -> "vDataFrame":
         """
         Verifies  if the  regular expression  is in each of  the
         vDataColumn records. The vDataColumn will be transformed.
@@ -238,6 +258,11 @@ class vDCText(vDCCorr):
         ----------
         pat: str
             Regular expression.
+        flags: str, optional
+            Vertica regular expression modifiers, for
+            example 'i' for a case-insensitive match or
+            'b' to treat the strings as octets, which is
+            faster on ASCII data.
 
         Returns
         -------
@@ -305,10 +330,11 @@ class vDCText(vDCCorr):
             | ``vDataFrame.``:py:meth:`~verticapy.vDataFrame.str_slice` : Slices the Regular Expression.
         """
         pat = pat.replace("'", "''")
-        return self.apply(func=f"REGEXP_COUNT({{}}, '{pat}') > 0")
+        modifier = _regexp_modifier(flags, "1")
+        return self.apply(func=f"REGEXP_COUNT({{}}, '{pat}'{modifier}) > 0")
 
     @save_verticapy_logs
-    def str_count(self, pat: str) -> "vDataFrame":
+    def str_count(self, pat: str, flags: Optional[str] = None) -> "vDataFrame":
         """
         Computes the number of matches for the regular expression in
         each  record  of  the vDataColumn.  The vDataColumn will  be
@@ -318,6 +344,11 @@ class vDCText(vDCCorr):
         ----------
         pat: str
             regular expression.
+        flags: str, optional
+            Vertica regular expression modifiers, for
+            example 'i' for a case-insensitive match or
+            'b' to treat the strings as octets, which is
+            faster on ASCII data.
 
         Returns
         -------
@@ -385,10 +416,11 @@ class vDCText(vDCCorr):
             | ``vDataFrame.``:py:meth:`~verticapy.vDataFrame.str_slice` : Slices the Regular Expression.
         """
         pat = pat.replace("'", "''")
-        return self.apply(func=f"REGEXP_COUNT({{}}, '{pat}')")
+        modifier = _regexp_modifier(flags, "1")
+        return self.apply(func=f"REGEXP_COUNT({{}}, '{pat}'{modifier})")
 
     @save_verticapy_logs
-    def str_extract(self, pat: str) -> "vDataFrame":
+    def str_extract(self, pat: str, flags: Optional[str] = None) -> "vDataFrame":
         """
         Extracts  the regular  expression in  each record of
         the vDataColumn. The vDataColumn will be transformed.
@@ -397,6 +429,11 @@ class vDCText(vDCCorr):
         ----------
         pat: str
             regular expression.
+        flags: str, optional
+            Vertica regular expression modifiers, for
+            example 'i' for a case-insensitive match or
+            'b' to treat the strings as octets, which is
+            faster on ASCII data.
 
         Returns
         -------
@@ -454,10 +491,13 @@ class vDCText(vDCCorr):
             | ``vDataFrame.``:py:meth:`~verticapy.vDataFrame.str_slice` : Slices the Regular Expression.
         """
         pat = pat.replace("'", "''")
-        return self.apply(func=f"REGEXP_SUBSTR({{}}, '{pat}')")
+        modifier = _regexp_modifier(flags, "1, 1")
+        return self.apply(func=f"REGEXP_SUBSTR({{}}, '{pat}'{modifier})")
 
     @save_verticapy_logs
-    def str_replace(self, to_replace: str, value: Optional[str] = None) -> "vDataFrame":
+    def str_replace(
+        self, to_replace: str, value: Optional[str] = None, flags: Optional[str] = None
+    ) -> "vDataFrame":
         """
         Replaces  the  regular expression matches in each  of  the
         vDataColumn record by an input value. The vDataColumn will
@@ -469,6 +509,11 @@ class vDCText(vDCCorr):
             Regular expression to replace.
         value: str, optional
             New value.
+        flags: str, optional
+            Vertica regular expression modifiers, for
+            example 'i' for a case-insensitive match or
+            'b' to treat the strings as octets, which is
+            faster on ASCII data.
 
         Returns
         -------
@@ -531,9 +576,19 @@ class vDCText(vDCCorr):
             | ``vDataFrame.``:py:meth:`~verticapy.vDataFrame.str_extract` : Extracts the Regular Expression.
             | ``vDataFrame.``:py:meth:`~verticapy.vDataFrame.str_slice` : Slices the Regular Expression.
         """
+        if (
+            to_replace
+            and not flags
+            and not (_REGEX_META.search(to_replace) or "\\" in value)
+        ):
+            # Literal replacement: no need for the regular expression engine.
+            fun = "REPLACE"
+        else:
+            fun = "REGEXP_REPLACE"
         to_replace = to_replace.replace("'", "''")
         value = value.replace("'", "''")
-        return self.apply(func=f"REGEXP_REPLACE({{}}, '{to_replace}', '{value}')")
+        modifier = _regexp_modifier(flags, "1, 0")
+        return self.apply(func=f"{fun}({{}}, '{to_replace}', '{value}'{modifier})")
 
     @save_verticapy_logs
     def str_slice(self, start: int, step: int) -> "vDataFrame":
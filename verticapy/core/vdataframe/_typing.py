@@ -38,7 +38,7 @@ if TYPE_CHECKING:
 
 class vDFTyping(vDFRead):
     @save_verticapy_logs
-    def astype(self, dtype: dict) -> "vDataFrame":
+    def astype(self, dtype: dict, validate: bool = True) -> "vDataFrame":
         """
         Converts the vDataColumns to the input types.
 
@@ -52,6 +52,12 @@ class vDFTyping(vDFRead):
 
             {"column1": "type1", ... "columnk": "typek"}
 
+        validate: bool, optional
+            If set to True, a sample of each vDataColumn
+            is cast to check the conversion. Otherwise,
+            the conversion errors are only raised by the
+            next query using the vDataColumns.
+
         Returns
         -------
         vDataFrame
@@ -152,7 +158,9 @@ class vDFTyping(vDFRead):
             :file: SPHINX_DIRECTORY/figures/core_vDataFrame_typing_astype2.html
         """
         for column in dtype:
-            self[self.format_colnames(column)].astype(dtype=dtype[column])
+            self[self.format_colnames(column)].astype(
+                dtype=dtype[column], validate=validate
+            )
         return self
 
     @save_verticapy_logs
@@ -236,7 +244,7 @@ class vDFTyping(vDFRead):
         columns = self.get_columns()
         for column in columns:
             if self[column].isbool():
-                self[column].astype("int")
+                self[column].astype("int", validate=False)
         return self
 
     def catcol(self, max_cardinality: int = 12) -> list:
@@ -627,7 +635,7 @@ class vDFTyping(vDFRead):
 
 class vDCTyping(vDCRead):
     @save_verticapy_logs
-    def astype(self, dtype: Union[str, type]) -> "vDataFrame":
+    def astype(self, dtype: Union[str, type], validate: bool = True) -> "vDataFrame":
         """
         Converts the vDataColumn to the input type.
 
@@ -642,6 +650,11 @@ class vDCTyping(vDCRead):
                 delimited string, you can add the header_names
                 as follows: dtype = 'vmap(age,name,date)',
                 where the header_names are age, name, and date.
+        validate: bool, optional
+            If set to True, a sample of the vDataColumn
+            is cast to check the conversion. Otherwise,
+            the conversion errors are only raised by the
+            next query using the vDataColumn.
 
         Returns
         -------
@@ -845,19 +858,20 @@ class vDCTyping(vDCRead):
                 transformation_2 = f"{{}}::{dtype}"
             transformation_2 = clean_query(transformation_2)
             transformation = (transformation_2.format(self._alias), transformation_2)
-            query = f"""
-                SELECT 
-                    /*+LABEL('vDataColumn.astype')*/ 
-                    {transformation[0]} AS {self} 
-                FROM {self._parent} 
-                WHERE {self} IS NOT NULL 
-                LIMIT 20"""
-            _executeSQL(
-                query,
-                title="Testing the Type casting.",
-                sql_push_ext=self._parent._vars["sql_push_ext"],
-                symbol=self._parent._vars["symbol"],
-            )
+            if validate:
+                query = f"""
+                    SELECT 
+                        /*+LABEL('vDataColumn.astype')*/ 
+                        {transformation[0]} AS {self} 
+                    FROM {self._parent} 
+                    WHERE {self} IS NOT NULL 
+                    LIMIT 20"""
+                _executeSQL(
+                    query,
+                    title="Testing the Type casting.",
+                    sql_push_ext=self._parent._vars["sql_push_ext"],
+                    symbol=self._parent._vars["symbol"],
+                )
             self._transf += [
                 (
                     transformation[1],
@@ -1023,7 +1037,13 @@ class vDCTyping(vDCRead):
 
             data["name"].ctype()
         """
-        return self._transf[-1][1].lower()
+        # The lowered type is cached with the transformation it
+        # comes from: tuples are immutable, the identity check is
+        # enough to detect any change of the transformations.
+        last = self._transf[-1]
+        if self._ctype_cache[0] is not last:
+            self._ctype_cache = (last, last[1].lower())
+        return self._ctype_cache[1]
 
     dtype = ctype
 
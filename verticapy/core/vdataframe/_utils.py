@@ -16,6 +16,7 @@ permissions and limitations under the License.
 """
 import copy
 from abc import abstractmethod
+from functools import lru_cache
 from typing import Optional, Union
 
 from verticapy._utils._sql._format import format_type, quote_ident
@@ -25,6 +26,18 @@ from verticapy.errors import MissingColumn
 from verticapy.plotting._utils import PlottingUtils
 
 
+@lru_cache(maxsize=128)
+def _colnames_lookup(columns: tuple[str, ...]) -> dict[str, str]:
+    """
+    Maps the normalized names of the input
+    columns to the columns themselves.
+    """
+    res = {}
+    for col in columns:
+        res.setdefault(quote_ident(col).lower(), col)
+    return res
+
+
 class vDFUtils(PlottingUtils):
     def __init__(self):
         """Must be overridden in final class"""
@@ -175,34 +188,23 @@ class vDFUtils(PlottingUtils):
                 else:
                     cols_to_check = copy.deepcopy(columns)
                 all_columns = self.get_columns()
+                lookup = _colnames_lookup(tuple(all_columns))
                 for column in cols_to_check:
                     result = []
-                    if column not in all_columns:
+                    if quote_ident(column).lower() not in lookup:
                         min_distance, min_distance_op = 1000, ""
-                        is_error = True
                         for col in all_columns:
-                            if quote_ident(column).lower() == quote_ident(col).lower():
-                                is_error = False
-                                break
-                            else:
-                                ldistance = self._levenshtein(column, col)
-                                if ldistance < min_distance:
-                                    min_distance, min_distance_op = ldistance, col
-                        if is_error:
-                            error_message = (
-                                f"The Virtual Column '{column}' doesn't exist."
-                            )
-                            if min_distance < 10:
-                                error_message += f"\nDid you mean '{min_distance_op}' ?"
-                            raise MissingColumn(error_message)
+                            ldistance = self._levenshtein(column, col)
+                            if ldistance < min_distance:
+                                min_distance, min_distance_op = ldistance, col
+                        error_message = f"The Virtual Column '{column}' doesn't exist."
+                        if min_distance < 10:
+                            error_message += f"\nDid you mean '{min_distance_op}' ?"
+                        raise MissingColumn(error_message)
 
             if isinstance(columns, str):
-                result = columns
-                vdf_columns = self.get_columns()
-                for col in vdf_columns:
-                    if quote_ident(columns).lower() == quote_ident(col).lower():
-                        result = col
-                        break
+                lookup = _colnames_lookup(tuple(self.get_columns()))
+                result = lookup.get(quote_ident(columns).lower(), columns)
             elif isinstance(columns, dict):
                 result = {}
                 for col in columns:
@@ -418,9 +420,5 @@ class vDFUtils(PlottingUtils):
             beginning of the function. Understanding it can be beneficial
             for developing new vDataFrame methods.
         """
-        columns = self.get_columns()
-        column = quote_ident(column).lower()
-        for col in columns:
-            if column == quote_ident(col).lower():
-                return True
-        return False
+        lookup = _colnames_lookup(tuple(self.get_columns()))
+        return quote_ident(column).lower() in lookup
@@ -52,6 +52,25 @@ from verticapy.sql.flex import (
     isflextable,
 )
 
+_CATALOG_METHODS: tuple[str, ...] = (
+    "cov",
+    "pearson",
+    "spearman",
+    "spearmand",
+    "kendall",
+    "cramer",
+    "biserial",
+    "regr_avgx",
+    "regr_avgy",
+    "regr_count",
+    "regr_intercept",
+    "regr_r2",
+    "regr_slope",
+    "regr_sxx",
+    "regr_sxy",
+    "regr_syy",
+)
+
 ###                                          _____
 #   _______    ______ ____________    ____  \    \
 #   \      |  |      |\           \   \   \ /____/|
@@ -904,27 +923,16 @@ class vDataColumn(vDCPlot, StringSQL):
         self._parent = parent
         self._alias = alias
         self._transf = format_type(transformations, dtype=list)
-        catalog = format_type(catalog, dtype=dict)
-        self._catalog = {
-            "cov": {},
-            "pearson": {},
-            "spearman": {},
-            "spearmand": {},
-            "kendall": {},
-            "cramer": {},
-            "biserial": {},
-            "regr_avgx": {},
-            "regr_avgy": {},
-            "regr_count": {},
-            "regr_intercept": {},
-            "regr_r2": {},
-            "regr_slope": {},
-            "regr_sxx": {},
-            "regr_sxy": {},
-            "regr_syy": {},
-        }
-        for key in catalog:
-            self._catalog[key] = catalog[key]
+        self._ctype_cache = (None, None)
+        self._row_cache = (None, 0, [])
+        self._head_cache = (None, None)
+        if catalog:
+            self._catalog = dict(catalog)
+            for method in _CATALOG_METHODS:
+                if method not in self._catalog:
+                    self._catalog[method] = {}
+        else:
+            self._catalog = {method: {} for method in _CATALOG_METHODS}
         self._init_transf = self._transf[0][0]
         if self._init_transf == "___VERTICAPY_UNDEFINED___":
             self._init_transf = self._alias
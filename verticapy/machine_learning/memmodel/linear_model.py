@@ -146,14 +146,18 @@ class LinearModel(InMemoryModel):
         Computes the model's score
         using the input Matrix.
         """
-        return self.intercept_ + np.sum(self.coef_ * np.array(X), axis=1)
+        return np.asarray(X) @ self.coef_ + self.intercept_
 
     def _predict_logit(self, X: ArrayLike) -> np.ndarray:
         """
         Computes the model's logit
         score using the input Matrix.
         """
-        return 1 / (1 + np.exp(-(self._predict_regression(X))))
+        score = np.asarray(self._predict_regression(X), dtype=np.float64)
+        np.negative(score, out=score)
+        np.exp(score, out=score)
+        score += 1
+        return np.reciprocal(score, out=score)
 
     def predict(self, X: ArrayLike) -> np.ndarray:
         """
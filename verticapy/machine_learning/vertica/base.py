@@ -18,6 +18,7 @@ permissions and limitations under the License.
 import copy
 import warnings
 from abc import abstractmethod
+from functools import lru_cache
 from typing import Any, Callable, Literal, Optional, Union, get_type_hints
 import numpy as np
 
@@ -75,6 +76,16 @@ if conf.get_import_success("graphviz"):
 ##
 
 
+@lru_cache(maxsize=None)
+def _get_init_params(model_class: type) -> frozenset:
+    """
+    Returns the names of the parameters of
+    the input model class constructor. They
+    are computed once per class.
+    """
+    return frozenset(get_type_hints(model_class.__init__))
+
+
 class VerticaModel(PlottingUtils):
     """
     Base Class for Vertica Models.
@@ -979,7 +990,7 @@ class VerticaModel(PlottingUtils):
 
         for param in self.parameters:
             if param == "class_weight":
-                if isinstance(self.parameters[param], (list, np.ndarray)):
+                if isinstance(self.parameters[param], (list, tuple, np.ndarray)):
                     parameters[
                         "class_weights"
                     ] = f"'{', '.join([str(p) for p in self.parameters[param]])}'"
@@ -1097,13 +1108,10 @@ class VerticaModel(PlottingUtils):
             specific to your class of interest,
             please refer to that particular class.
         """
-        all_init_params = list(get_type_hints(self.__init__).keys())
-        parameters = copy.deepcopy(self.parameters)
-        parameters_keys = list(parameters.keys())
-        for p in parameters_keys:
-            if p not in all_init_params:
-                del parameters[p]
-        return parameters
+        all_init_params = _get_init_params(type(self))
+        return copy.deepcopy(
+            {p: v for p, v in self.parameters.items() if p in all_init_params}
+        )
 
     def set_params(self, parameters: Optional[dict] = None, **kwargs) -> None:
         """
@@ -1183,12 +1191,14 @@ class VerticaModel(PlottingUtils):
             please refer to that particular class.
         """
         parameters = format_type(parameters, dtype=dict)
-        all_init_params = list(get_type_hints(self.__init__).keys())
-        new_parameters = copy.deepcopy({**self.parameters, **kwargs})
-        new_parameters_keys = list(new_parameters.keys())
-        for p in new_parameters_keys:
-            if p not in all_init_params:
-                del new_parameters[p]
+        all_init_params = _get_init_params(type(self))
+        new_parameters = copy.deepcopy(
+            {
+                p: v
+                for p, v in {**self.parameters, **kwargs}.items()
+                if p in all_init_params
+            }
+        )
         for p in parameters:
             if p not in all_init_params:
                 warning_message = (
@@ -1321,6 +1331,15 @@ class VerticaModel(PlottingUtils):
 
     # I/O Methods.
 
+    def _to_memmodel(self):
+        """
+        Returns the InMemory model used internally by
+        the I/O methods. Models which cache it override
+        this method; the returned object must not be
+        modified.
+        """
+        return self.to_memmodel()
+
     def deploySQL(self, X: Optional[SQLColumns] = None) -> str:
         """
         Returns the SQL code
@@ -1915,7 +1934,7 @@ class VerticaModel(PlottingUtils):
             specific to your class of interest,
             please refer to that particular class.
         """
-        model = self.to_memmodel()
+        model = self._to_memmodel()
         if return_proba:
             return model.predict_proba
         elif hasattr(model, "predict") and not return_distance_clusters:
@@ -2059,7 +2078,7 @@ class VerticaModel(PlottingUtils):
         X = format_type(X, dtype=list)
         if len(X) == 0:
             X = self.X
-        model = self.to_memmodel()
+        model = self._to_memmodel()
         if return_proba:
             return model.predict_proba_sql(X)
         elif hasattr(model, "predict") and not return_distance_clusters:
@@ -5239,7 +5258,7 @@ class MulticlassClassifier(Supervised):
         X = format_type(X, dtype=list, na_out=self.X)
         X = quote_ident(X)
         if not self._is_native:
-            sql = self.to_memmodel().predict_proba_sql(X)
+            sql = self._to_memmodel().predict_proba_sql(X)
         else:
             sql = [
                 f"""
@@ -5280,7 +5299,7 @@ class MulticlassClassifier(Supervised):
                         sql = sql.format(non_pos_label)
             else:
                 if not self._is_native:
-                    sql = self.to_memmodel().predict_sql(X)
+                    sql = self._to_memmodel().predict_sql(X)
                 else:
                     sql = sql[1]
         return clean_query(sql)
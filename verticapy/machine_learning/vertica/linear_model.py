@@ -61,8 +61,10 @@ class LinearModel:
         Computes the model's attributes.
         """
         details = self.get_vertica_attributes("details")
-        self.coef_ = np.array(details["coefficient"][1:])
-        self.intercept_ = details["coefficient"][0]
+        coefs = np.asarray(details["coefficient"], dtype=np.float64)
+        self.coef_ = coefs[1:]
+        self.intercept_ = float(coefs[0])
+        self._memmodel_cache = None
 
     # Features Importance Methods.
 
@@ -293,6 +295,16 @@ class LinearModel:
         """
         return mm.LinearModel(self.coef_, self.intercept_)
 
+    def _to_memmodel(self) -> mm.LinearModel:
+        """
+        Returns the InMemory model used by ``to_python``
+        and ``to_sql``. It is built once and shared, so
+        it must not be modified.
+        """
+        if getattr(self, "_memmodel_cache", None) is None:
+            self._memmodel_cache = self.to_memmodel()
+        return self._memmodel_cache
+
     # Plotting Methods.
 
     def plot(
@@ -453,8 +465,10 @@ class LinearModelClassifier(LinearModel):
         Computes the model's attributes.
         """
         details = self.get_vertica_attributes("details")
-        self.coef_ = np.array(details["coefficient"][1:])
-        self.intercept_ = details["coefficient"][0]
+        coefs = np.asarray(details["coefficient"], dtype=np.float64)
+        self.coef_ = coefs[1:]
+        self.intercept_ = float(coefs[0])
+        self._memmodel_cache = None
 
     # I/O Methods.
 
@@ -496,6 +510,16 @@ class LinearModelClassifier(LinearModel):
         """
         return mm.LinearModelClassifier(self.coef_, self.intercept_)
 
+    def _to_memmodel(self) -> mm.LinearModelClassifier:
+        """
+        Returns the InMemory model used by ``to_python``
+        and ``to_sql``. It is built once and shared, so
+        it must not be modified.
+        """
+        if getattr(self, "_memmodel_cache", None) is None:
+            self._memmodel_cache = self.to_memmodel()
+        return self._memmodel_cache
+
     # Plotting Methods.
 
     def plot(
@@ -29,6 +29,8 @@ from verticapy.machine_learning.vertica.linear_model import (
     LinearModelClassifier,
 )
 
+_DEFAULT_CLASS_WEIGHT: tuple = (1, 1)
+
 """
 Algorithms used for regression.
 """
@@ -657,6 +659,8 @@ class LinearSVC(LinearModelClassifier, BinaryClassifier):
             the number of samples.
         - none:
             No weights are used.
+
+        If set to None, the weights are set to [1, 1].
     max_iter: int, optional
         The  maximum  number of iterations  that  the
         algorithm performs.
@@ -1278,10 +1282,12 @@ class LinearSVC(LinearModelClassifier, BinaryClassifier):
         C: float = 1.0,
         intercept_scaling: float = 1.0,
         intercept_mode: Literal["regularized", "unregularized"] = "regularized",
-        class_weight: Union[Literal["auto", "none"], list] = [1, 1],
+        class_weight: Union[Literal["auto", "none"], list, tuple, None] = None,
         max_iter: int = 100,
     ) -> None:
         super().__init__(name, overwrite_model)
+        if class_weight is None:
+            class_weight = list(_DEFAULT_CLASS_WEIGHT)
         self.parameters = {
             "tol": tol,
             "C": C,
@@ -14,59 +14,69 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
-from verticapy.plotting._matplotlib.animated.bar import AnimatedBarChart
-from verticapy.plotting._matplotlib.animated.bubble import AnimatedBubblePlot
-from verticapy.plotting._matplotlib.animated.line import AnimatedLinePlot
-from verticapy.plotting._matplotlib.animated.pie import AnimatedPieChart
+import importlib
 
-from verticapy.plotting._matplotlib.machine_learning.champion_challenger import (
-    ChampionChallengerPlot,
-)
-from verticapy.plotting._matplotlib.machine_learning.elbow import ElbowCurve
-from verticapy.plotting._matplotlib.machine_learning.importance import (
-    ImportanceBarChart,
-)
-from verticapy.plotting._matplotlib.machine_learning.kmeans import VoronoiPlot
-from verticapy.plotting._matplotlib.machine_learning.lof import LOFPlot
-from verticapy.plotting._matplotlib.machine_learning.logistic_reg import (
-    LogisticRegressionPlot,
-)
-from verticapy.plotting._matplotlib.machine_learning.model_evaluation import (
-    CutoffCurve,
-    LiftChart,
-    PRCCurve,
-    ROCCurve,
-)
-from verticapy.plotting._matplotlib.machine_learning.pca import (
-    PCACirclePlot,
-    PCAScreePlot,
-    PCAVarPlot,
-)
-from verticapy.plotting._matplotlib.machine_learning.regression import RegressionPlot
-from verticapy.plotting._matplotlib.machine_learning.regression_tree import (
-    RegressionTreePlot,
-)
-from verticapy.plotting._matplotlib.machine_learning.stepwise import StepwisePlot
-from verticapy.plotting._matplotlib.machine_learning.svm import SVMClassifierPlot
-from verticapy.plotting._matplotlib.machine_learning.tsa import TSPlot
+# Plotting classes are imported on first access (PEP 562) so that
+# importing VerticaPy does not load the matplotlib chart submodules.
+# matplotlib itself is still imported by verticapy.plotting: its
+# named colors complete the default palette used by every library.
+_LAZY_IMPORTS = {
+    "AnimatedBarChart": "verticapy.plotting._matplotlib.animated.bar",
+    "AnimatedBubblePlot": "verticapy.plotting._matplotlib.animated.bubble",
+    "AnimatedLinePlot": "verticapy.plotting._matplotlib.animated.line",
+    "AnimatedPieChart": "verticapy.plotting._matplotlib.animated.pie",
+    "ChampionChallengerPlot": "verticapy.plotting._matplotlib.machine_learning.champion_challenger",
+    "ElbowCurve": "verticapy.plotting._matplotlib.machine_learning.elbow",
+    "ImportanceBarChart": "verticapy.plotting._matplotlib.machine_learning.importance",
+    "VoronoiPlot": "verticapy.plotting._matplotlib.machine_learning.kmeans",
+    "LOFPlot": "verticapy.plotting._matplotlib.machine_learning.lof",
+    "LogisticRegressionPlot": "verticapy.plotting._matplotlib.machine_learning.logistic_reg",
+    "CutoffCurve": "verticapy.plotting._matplotlib.machine_learning.model_evaluation",
+    "LiftChart": "verticapy.plotting._matplotlib.machine_learning.model_evaluation",
+    "PRCCurve": "verticapy.plotting._matplotlib.machine_learning.model_evaluation",
+    "ROCCurve": "verticapy.plotting._matplotlib.machine_learning.model_evaluation",
+    "PCACirclePlot": "verticapy.plotting._matplotlib.machine_learning.pca",
+    "PCAScreePlot": "verticapy.plotting._matplotlib.machine_learning.pca",
+    "PCAVarPlot": "verticapy.plotting._matplotlib.machine_learning.pca",
+    "RegressionPlot": "verticapy.plotting._matplotlib.machine_learning.regression",
+    "RegressionTreePlot": "verticapy.plotting._matplotlib.machine_learning.regression_tree",
+    "StepwisePlot": "verticapy.plotting._matplotlib.machine_learning.stepwise",
+    "SVMClassifierPlot": "verticapy.plotting._matplotlib.machine_learning.svm",
+    "TSPlot": "verticapy.plotting._matplotlib.machine_learning.tsa",
+    "ACFPlot": "verticapy.plotting._matplotlib.acf",
+    "ACFPACFPlot": "verticapy.plotting._matplotlib.acf",
+    "BarChart": "verticapy.plotting._matplotlib.bar",
+    "BarChart2D": "verticapy.plotting._matplotlib.bar",
+    "HorizontalBarChart": "verticapy.plotting._matplotlib.barh",
+    "HorizontalBarChart2D": "verticapy.plotting._matplotlib.barh",
+    "BoxPlot": "verticapy.plotting._matplotlib.boxplot",
+    "ContourPlot": "verticapy.plotting._matplotlib.contour",
+    "DensityPlot": "verticapy.plotting._matplotlib.density",
+    "DensityPlot2D": "verticapy.plotting._matplotlib.density",
+    "MultiDensityPlot": "verticapy.plotting._matplotlib.density",
+    "HeatMap": "verticapy.plotting._matplotlib.heatmap",
+    "HexbinMap": "verticapy.plotting._matplotlib.hexbin",
+    "Histogram": "verticapy.plotting._matplotlib.hist",
+    "LinePlot": "verticapy.plotting._matplotlib.line",
+    "MultiLinePlot": "verticapy.plotting._matplotlib.line",
+    "OutliersPlot": "verticapy.plotting._matplotlib.outliers",
+    "PieChart": "verticapy.plotting._matplotlib.pie",
+    "NestedPieChart": "verticapy.plotting._matplotlib.pie",
+    "RangeCurve": "verticapy.plotting._matplotlib.range",
+    "ScatterMatrix": "verticapy.plotting._matplotlib.scatter",
+    "ScatterPlot": "verticapy.plotting._matplotlib.scatter",
+    "SpiderChart": "verticapy.plotting._matplotlib.spider",
+    "CandleStick": "verticapy.plotting._matplotlib.candlestick",
+}
 
-from verticapy.plotting._matplotlib.acf import ACFPlot, ACFPACFPlot
-from verticapy.plotting._matplotlib.bar import BarChart, BarChart2D
-from verticapy.plotting._matplotlib.barh import HorizontalBarChart, HorizontalBarChart2D
-from verticapy.plotting._matplotlib.boxplot import BoxPlot
-from verticapy.plotting._matplotlib.contour import ContourPlot
-from verticapy.plotting._matplotlib.density import (
-    DensityPlot,
-    DensityPlot2D,
-    MultiDensityPlot,
-)
-from verticapy.plotting._matplotlib.heatmap import HeatMap
-from verticapy.plotting._matplotlib.hexbin import HexbinMap
-from verticapy.plotting._matplotlib.hist import Histogram
-from verticapy.plotting._matplotlib.line import LinePlot, MultiLinePlot
-from verticapy.plotting._matplotlib.outliers import OutliersPlot
-from verticapy.plotting._matplotlib.pie import PieChart, NestedPieChart
-from verticapy.plotting._matplotlib.range import RangeCurve
-from verticapy.plotting._matplotlib.scatter import ScatterMatrix, ScatterPlot
-from verticapy.plotting._matplotlib.spider import SpiderChart
-from verticapy.plotting._matplotlib.candlestick import CandleStick
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        obj = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -56,7 +56,7 @@ class BarChart(MatplotlibBase):
         style_kwargs = self._fix_color_style_kwargs(style_kwargs)
         ax, fig, style_kwargs = self._get_ax_fig(
             ax,
-            size=(min(int(len(self.data["x"]) / 1.8) + 1, 600), 6),
+            size=(min(len(self.data["x"]) * 5 // 9 + 1, 600), 6),
             set_axis_below=True,
             grid="y",
             style_kwargs=style_kwargs,
@@ -69,15 +69,16 @@ class BarChart(MatplotlibBase):
         )
         ax.set_xlabel(self.layout["column"])
         if self.data["is_categorical"]:
-            xticks = self.data["x"]
-            xticks_label = self._format_string(self.layout["labels"])
+            ax.set_xticks(self.data["x"])
+            ax.set_xticklabels(self._format_string(self.layout["labels"]), rotation=90)
         else:
             xticks = [li[0] for li in self.layout["labels"]] + [
                 self.layout["labels"][-1][-1]
             ]
-            xticks_label = xticks
-        ax.set_xticks(xticks)
-        ax.set_xticklabels(xticks_label, rotation=90)
+            # The numerical edges are formatted by the default
+            # ScalarFormatter, no need to stringify them.
+            ax.set_xticks(xticks)
+            ax.tick_params(axis="x", labelrotation=90)
         ax.set_ylabel(self.layout["method"])
         return ax
 
@@ -122,32 +123,38 @@ class BarChart2D(MatplotlibBase):
             grid="y",
             style_kwargs=style_kwargs,
         )
+        js = np.arange(m)
+        # One row per bar series, each series is then read
+        # from contiguous memory.
+        cols = np.ascontiguousarray(self.data["X"].T)
+        if self.layout["kind"] == "stacked":
+            # The bottom of each bar is the cumulative sum
+            # of the previous ones.
+            bottoms = np.zeros((n, m))
+            np.cumsum(cols[:-1].astype(float), axis=0, out=bottoms[1:])
+        else:
+            offsets = np.arange(n) * self.init_style["width"] / n
         for i in range(0, n):
             params = {
-                "x": [j for j in range(m)],
-                "height": self.data["X"][:, i],
+                "x": js.tolist(),
+                "height": cols[i],
                 "label": self.layout["y_labels"][i],
                 "color": colors[i % len(colors)],
                 **self.init_style,
             }
             params = self._update_dict(params, style_kwargs, i)
             if self.layout["kind"] == "stacked":
-                if i == 0:
-                    bottom = np.array([0.0 for j in range(m)])
-                else:
-                    bottom += self.data["X"][:, i - 1].astype(float)
-                params["bottom"] = bottom
+                params["bottom"] = bottoms[i]
             else:
-                params["x"] = [j + i * self.init_style["width"] / n for j in range(m)]
+                params["x"] = (js + offsets[i]).tolist()
                 params["width"] = self.init_style["width"] / n
             ax.bar(**params)
         if self.layout["kind"] == "stacked":
-            xticks = [j for j in range(m)]
+            xticks = js.tolist()
         else:
-            xticks = [
-                j + self.init_style["width"] / 2 - self.init_style["width"] / 2 / n
-                for j in range(m)
-            ]
+            xticks = (
+                js + self.init_style["width"] / 2 - self.init_style["width"] / 2 / n
+            ).tolist()
         ax.set_xticks(xticks)
         ax.set_xticklabels(self.layout["x_labels"], rotation=90)
         ax.set_xlabel(self.layout["columns"][0])
@@ -58,7 +58,7 @@ class HorizontalBarChart(MatplotlibBase):
         style_kwargs = self._fix_color_style_kwargs(style_kwargs)
         ax, fig, style_kwargs = self._get_ax_fig(
             ax,
-            size=(10, min(int(len(self.data["x"]) / 1.8) + 1, 600)),
+            size=(10, min(len(self.data["x"]) * 5 // 9 + 1, 600)),
             grid="x",
             style_kwargs=style_kwargs,
         )
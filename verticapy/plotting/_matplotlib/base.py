@@ -58,7 +58,9 @@ class MatplotlibBase(PlottingBase):
             return ax, plt, kwargs
         elif not ax:
             fig, ax = plt.subplots()
-            if conf.get_import_success("IPython"):
+            if conf.get_import_success("IPython") and tuple(
+                fig.get_size_inches()
+            ) != tuple(size):
                 fig.set_size_inches(*size)
             if grid:
                 if grid in ("x", "y"):
@@ -98,10 +100,9 @@ class MatplotlibBase(PlottingBase):
 
     @staticmethod
     def _format_string(x: ArrayLike, th: int = 50) -> ArrayLike:
-        res = copy.deepcopy(x)
         if isinstance(x[0], str):
-            n = len(res)
-            for i in range(n):
-                if len(str(res[i])) > th:
-                    res[i] = str(res[i][: th - 3]) + "..."
-        return res
+            return [
+                xi_str[: th - 3] + "..." if len(xi_str := str(xi)) > th else xi
+                for xi in x
+            ]
+        return copy.deepcopy(x)
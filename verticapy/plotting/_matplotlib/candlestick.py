@@ -67,7 +67,7 @@ class CandleStick(MatplotlibBase):
             style_kwargs.pop("color")
         ax, _, style_kwargs = self._get_ax_fig(
             ax,
-            size=(min(int(len(self.data["x"]) / 1.8) + 1, 600), 6),
+            size=(min(len(self.data["x"]) * 5 // 9 + 1, 600), 6),
             set_axis_below=True,
             grid="y",
             style_kwargs=style_kwargs,
@@ -112,12 +112,12 @@ class PieChart(MatplotlibBase):
             ):
                 current_explode = min(0.9, current_explode * 1.4)
                 explode[idx] = current_explode
-        if self.layout["method"].lower() == "density":
+        method = self.layout["method"].lower()
+        if method == "density":
             autopct = "%1.1f%%"
         else:
-            if (self.layout["method"].lower() in ["sum", "count"]) or (
-                (self.layout["method"].lower() in ["min", "max"])
-                and (self.layout["of_cat"] == "int")
+            if (method in ["sum", "count"]) or (
+                (method in ["min", "max"]) and (self.layout["of_cat"] == "int")
             ):
                 category = "int"
             else:
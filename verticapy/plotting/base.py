@@ -15,9 +15,11 @@ See the  License for the specific  language governing
 permissions and limitations under the License.
 """
 import copy
+import datetime
 import math
 import random
 import warnings
+from functools import lru_cache
 from typing import Callable, Literal, Optional, Union, TYPE_CHECKING
 
 import numpy as np
@@ -45,7 +47,7 @@ from verticapy.core.tablesample.base import TableSample
 from verticapy.plotting.sql import PlottingBaseSQL
 
 if conf.get_import_success("dateutil"):
-    from dateutil.parser import parse
+    from dateutil.parser import isoparse, parse
 
 if TYPE_CHECKING:
     from verticapy.core.vdataframe.base import vDataFrame, vDataColumn
@@ -148,6 +150,55 @@ def color_validator(val: Union[str, list, None]) -> Literal[True]:
 colors_option = conf.Option("colors", None, "", color_validator, COLORS_OPTIONS)
 conf.register_option(colors_option)
 
+
+@lru_cache(maxsize=None)
+def _get_default_colors(theme: str) -> tuple:
+    """
+    Returns the default palette of the input theme
+    completed by the other matplotlib colors. The
+    shuffle is only done once per theme.
+    """
+    colors = list(COLORS_OPTIONS["sphinx" if theme == "sphinx" else "default"])
+    all_colors = [plt_colors.cnames[key] for key in plt_colors.cnames]
+    random.shuffle(all_colors)
+    return tuple(colors + [c for c in all_colors if c not in colors])
+
+
+def _optimal_bar_width(
+    count: int,
+    vmin: PythonNumber,
+    q1: PythonNumber,
+    q3: PythonNumber,
+    vmax: PythonNumber,
+) -> tuple[float, float]:
+    """
+    Returns the Sturges and Freedman-Diaconis bar
+    widths computed from the statistics of a column.
+    Both are floored at 1e-99, which is also the
+    width of an empty column.
+    """
+    if not count:
+        return 1e-99, 1e-99
+    count = int(count)
+    # floor(log2(n)) + 2 == n.bit_length() + 1
+    sturges = max(float(vmax - vmin) / (count.bit_length() + 1), 1e-99)
+    fd = max(2.0 * float(q3 - q1) / count ** (1.0 / 3.0), 1e-99)
+    return sturges, fd
+
+
+"""
+Aggregations: They are used when computing the charts.
+"""
+
+METHOD_ALIASES: dict[str, str] = {"median": "50%", "mean": "avg"}
+
+AGGREGATION_FUNCTIONS: dict[str, Callable] = {
+    "avg": np.mean,
+    "min": min,
+    "max": max,
+    "sum": sum,
+}
+
 """
 Plotting Base Class.
 """
@@ -325,23 +376,14 @@ class PlottingBase(PlottingBaseSQL):
                 if isinstance(idx, NoneType):
                     idx = 0
                 return d["color"][idx % len(d["color"])]
-        elif isinstance(idx, NoneType):
-            if not conf.get_option("colors"):
-                if conf.get_option("theme") == "sphinx":
-                    colors = COLORS_OPTIONS["sphinx"]
-                else:
-                    colors = COLORS_OPTIONS["default"]
-                all_colors = [plt_colors.cnames[key] for key in plt_colors.cnames]
-                random.shuffle(all_colors)
-                for c in all_colors:
-                    if c not in colors:
-                        colors += [c]
-                return colors
-            else:
-                return conf.get_option("colors")
-        else:
-            colors = self.get_colors()
-            return colors[idx % len(colors)]
+        colors = conf.get_option("colors")
+        if not colors:
+            colors = _get_default_colors(conf.get_option("theme"))
+            if isinstance(idx, NoneType):
+                return list(colors)
+        if isinstance(idx, NoneType):
+            return colors
+        return colors[idx % len(colors)]
 
     def get_cmap(
         self,
@@ -487,60 +529,29 @@ class PlottingBase(PlottingBaseSQL):
 
     @staticmethod
     def _map_method(method: str, of: str) -> tuple[str, str, Optional[Callable], bool]:
-        is_standard = True
-        fun_map = {
-            "avg": np.mean,
-            "min": min,
-            "max": max,
-            "sum": sum,
-        }
         method = method.lower()
-        if method == "median":
-            method = "50%"
-        elif method == "mean":
-            method = "avg"
-        if (
-            method not in ["avg", "min", "max", "sum", "density", "count"]
-            and "%" != method[-1]
-        ) and of:
-            raise ValueError(
-                "Parameter 'of' must be empty when using customized aggregations."
+        method = METHOD_ALIASES.get(method, method)
+        if method in ("density", "count"):
+            return method, "count(*)", sum, True
+        elif of and method in AGGREGATION_FUNCTIONS:
+            aggregate = f"{method.upper()}({quote_ident(of)})"
+            return method, aggregate, AGGREGATION_FUNCTIONS[method], True
+        elif of and method.endswith("%"):
+            q = float(method[0:-1]) / 100
+            aggregate = (
+                f"APPROXIMATE_PERCENTILE({quote_ident(of)} "
+                f"USING PARAMETERS percentile = {q})"
             )
-        if (
-            (method in ["avg", "min", "max", "sum"])
-            or (isinstance(method, str) and method.endswith("%"))
-        ) and (of):
-            if method in ["avg", "min", "max", "sum"]:
-                aggregate = f"{method.upper()}({quote_ident(of)})"
-                fun = fun_map[method]
-            elif isinstance(method, str) and method.endswith("%"):
-                q = float(method[0:-1]) / 100
-                aggregate = f"""
-                    APPROXIMATE_PERCENTILE({quote_ident(of)} 
-                        USING PARAMETERS
-                        percentile = {q})"""
-
-                def fun(x: ArrayLike) -> float:
-                    return np.quantile(x, q)
 
-            else:
-                raise ValueError(
-                    "The parameter 'method' must be in [avg|mean|min|max|sum|"
-                    f"median|q%] or a customized aggregation. Found {method}."
-                )
-        elif method in ["density", "count"]:
-            aggregate = "count(*)"
-            fun = sum
-        elif isinstance(method, str):
-            aggregate = method
-            fun = None
-            is_standard = False
-        else:
+            def fun(x: ArrayLike) -> float:
+                return np.quantile(x, q)
+
+            return method, aggregate, fun, True
+        elif of:
             raise ValueError(
-                "The parameter 'method' must be in [avg|mean|min|max|sum|"
-                f"median|q%] or a customized aggregation. Found {method}."
+                "Parameter 'of' must be empty when using customized aggregations."
             )
-        return method, aggregate, fun, is_standard
+        return method, method, None, False
 
     @staticmethod
     def _parse_datetime(D: list) -> list:
@@ -548,10 +559,16 @@ class PlottingBase(PlottingBaseSQL):
         Parses the list and casts the value to the datetime
         format if possible.
         """
+        if len(D) == 0 or not isinstance(D[0], str):
+            # Nothing to parse: values are already typed.
+            return copy.copy(D)
         try:
-            return np.array([parse(d) for d in D])
+            try:
+                return np.array([isoparse(d) for d in D])
+            except ValueError:
+                return np.array([parse(d) for d in D])
         except:
-            return copy.deepcopy(D)
+            return copy.copy(D)
 
     @staticmethod
     def _update_dict(
@@ -562,21 +579,123 @@ class PlottingBase(PlottingBaseSQL):
         """
         Updates the input dictionary using another one.
         """
-        d = {}
-        for elem in d1:
-            d[elem] = d1[elem]
-        for elem in d2:
-            if elem == "color":
-                if isinstance(d2["color"], str):
-                    d["color"] = d2["color"]
-                elif color_idx < 0:
-                    d["color"] = list(d2["color"])
-                else:
-                    d["color"] = d2["color"][color_idx % len(d2["color"])]
-            else:
-                d[elem] = d2[elem]
+        d = {**d1, **d2}
+        color = d2.get("color")
+        if not isinstance(color, (str, NoneType)):
+            d["color"] = list(color) if color_idx < 0 else color[color_idx % len(color)]
         return d
 
+    @staticmethod
+    def _split_heights(
+        query_result: list, count: int, density: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Splits the fetched (key, aggregate) rows into the keys
+        and the bar heights. NULL aggregates are set to 0.
+        """
+        rows = np.asarray(query_result, dtype=object).reshape(-1, 2)
+        raw = rows[:, 1]
+        mask = raw != None
+        y = np.zeros(len(raw), dtype=np.float64)
+        y[mask] = raw[mask].astype(np.float64)
+        if density:
+            y /= float(count)
+        return rows[:, 0], y
+
+    @staticmethod
+    def _prefetch_1d_stats(vdc: "vDataColumn") -> None:
+        """
+        Computes the cardinality, the number of rows and the
+        min / max of the input vDataColumn in a single query
+        and stores them in the catalog.
+        """
+        if not conf.get_option("cache"):
+            return None
+        vdf = vdc._parent
+        cast = "::int" if vdc.isbool() else ""
+        keys = ["approx_unique"]
+        if vdc.isnum() or vdc.isdate():
+            keys += ["min", "max"]
+        has_count = vdf._get_catalog_value("VERTICAPY_COUNT") != (
+            "VERTICAPY_NOT_PRECOMPUTED"
+        )
+        keys = [
+            key
+            for key in keys
+            if vdf._get_catalog_value(vdc._alias, key) == "VERTICAPY_NOT_PRECOMPUTED"
+        ]
+        if not keys and has_count:
+            return None
+        fun = {
+            "approx_unique": f"APPROXIMATE_COUNT_DISTINCT({vdc})",
+            "min": f"MIN({vdc}{cast})",
+            "max": f"MAX({vdc}{cast})",
+        }
+        try:
+            result = _executeSQL(
+                query=f"""
+                    SELECT
+                        /*+LABEL('plotting._matplotlib._prefetch_1d_stats')*/
+                        {", ".join(["COUNT(*)"] + [fun[key] for key in keys])}
+                    FROM {vdf}""",
+                title="Computing the vDataColumn main statistics.",
+                method="fetchrow",
+                sql_push_ext=vdf._vars["sql_push_ext"],
+                symbol=vdf._vars["symbol"],
+            )
+        except QueryError:
+            return None
+        vdf._vars["count"] = result[0]
+        if keys:
+            vdf._update_catalog({"index": keys, vdc._alias: list(result[1:])})
+
+    @staticmethod
+    def _numh_batch(vdf: "vDataFrame", columns: SQLColumns) -> list[float]:
+        """
+        Computes the optimal bar width of each input numerical
+        column (see vDataColumn.numh) using a single query.
+        """
+        result, to_compute = {}, []
+        for column in columns:
+            pre_comp = vdf._get_catalog_value(column, "numh")
+            if pre_comp != "VERTICAPY_NOT_PRECOMPUTED":
+                result[column] = pre_comp
+            else:
+                to_compute += [column]
+        if to_compute:
+            fun = []
+            for column in to_compute:
+                col = f"{column}::int" if vdf[column].isbool() else column
+                fun += [
+                    f"COUNT({col})",
+                    f"MIN({col})",
+                    f"APPROXIMATE_PERCENTILE({col} USING PARAMETERS percentile = 0.25)",
+                    f"APPROXIMATE_PERCENTILE({col} USING PARAMETERS percentile = 0.75)",
+                    f"MAX({col})",
+                ]
+            res = _executeSQL(
+                query=f"""
+                    SELECT
+                        /*+LABEL('plotting._matplotlib._numh_batch')*/
+                        {", ".join(fun)}
+                    FROM {vdf}""",
+                title="Computing the optimal h of each column.",
+                method="fetchrow",
+                sql_push_ext=vdf._vars["sql_push_ext"],
+                symbol=vdf._vars["symbol"],
+            )
+            for idx, column in enumerate(to_compute):
+                sturges, fd = _optimal_bar_width(*res[5 * idx : 5 * idx + 5])
+                result[column] = max(sturges, fd)
+                vdf._update_catalog({"index": ["numh"], column: [result[column]]})
+        h = []
+        for column in columns:
+            if vdf[column].category() == "int":
+                h += [max(math.floor(result[column]), 1)]
+            else:
+                h += [result[column]]
+        return h
+
     # Attributes Computations.
 
     # Features Importance.
@@ -627,12 +746,14 @@ class PlottingBase(PlottingBaseSQL):
         other_columns = ""
         of = vdc._parent.format_colnames(of)
         method, aggregate, aggregate_fun, is_standard = self._map_method(method, of)
+        is_density = method == "density"
         if not is_standard:
             other_columns = ", " + ", ".join(
                 vdc._parent.get_columns(exclude_columns=[vdc._alias])
             )
         # depending on the cardinality, the type, the vDataColumn
         # can be treated as categorical or not
+        self._prefetch_1d_stats(vdc)
         try:
             cardinality = vdc.nunique(True)
         except QueryError:
@@ -673,50 +794,53 @@ class PlottingBase(PlottingBaseSQL):
                         f"(SELECT {enum_trans + other_columns} FROM {table}) enum_table"
                     )
                 cast_alias = to_varchar(vdc.category(), vdc._alias)
-                query = f"""
-                    (SELECT 
-                        /*+LABEL('plotting._matplotlib._compute_plot_params')*/ 
-                        COALESCE({cast_alias}, 'NULL') AS {vdc},
-                        {aggregate}
-                     FROM {table} 
-                     GROUP BY 1
-                     ORDER BY 2 DESC 
-                     LIMIT {max_cardinality})"""
                 if cardinality > max_cardinality:
-                    query += f"""
-                        UNION 
-                        (SELECT 
-                            'Others',
-                            {aggregate} 
-                         FROM {table}
-                         WHERE {vdc} NOT IN
-                            (SELECT 
-                                {vdc} 
-                            FROM
-                             (SELECT 
-                                COALESCE({cast_alias}, 'NULL') AS {vdc},
-                                {aggregate}
-                             FROM {table} 
-                             GROUP BY 1
-                             ORDER BY 2 DESC 
-                             LIMIT {max_cardinality}) x))"""
+                    # The categories are ranked once and the tail is
+                    # folded into 'Others' in the same aggregation.
+                    query = f"""
+                        SELECT
+                            /*+LABEL('plotting._matplotlib._compute_plot_params')*/
+                            (CASE
+                                WHEN verticapy_rank <= {max_cardinality}
+                                THEN verticapy_key
+                                ELSE 'Others'
+                             END) AS {vdc},
+                            {aggregate}
+                        FROM {table}
+                        INNER JOIN
+                            (SELECT
+                                verticapy_key,
+                                ROW_NUMBER() OVER (ORDER BY verticapy_agg DESC)
+                                    AS verticapy_rank
+                             FROM
+                                (SELECT
+                                    COALESCE({cast_alias}, 'NULL') AS verticapy_key,
+                                    {aggregate} AS verticapy_agg
+                                 FROM {table}
+                                 GROUP BY 1) verticapy_groups) verticapy_ranks
+                        ON COALESCE({cast_alias}, 'NULL') = verticapy_key
+                        GROUP BY 1
+                        ORDER BY MAX(verticapy_rank)"""
+                else:
+                    query = f"""
+                        SELECT 
+                            /*+LABEL('plotting._matplotlib._compute_plot_params')*/ 
+                            COALESCE({cast_alias}, 'NULL') AS {vdc},
+                            {aggregate}
+                        FROM {table} 
+                        GROUP BY 1
+                        ORDER BY 2 DESC 
+                        LIMIT {max_cardinality}"""
             query_result = _executeSQL(
-                query=query, title="Computing the histogram heights", method="fetchall"
-            )
-            y = (
-                [
-                    item[1] / float(count) if not isinstance(item[1], NoneType) else 0
-                    for item in query_result
-                ]
-                if (method.lower() == "density")
-                else [
-                    item[1] if not isinstance(item[1], NoneType) else 0
-                    for item in query_result
-                ]
+                query=query,
+                title="Computing the histogram heights",
+                method="fetchnumpy",
             )
-            x = [0.4 * i + 0.2 for i in range(0, len(y))]
+            keys, y = self._split_heights(query_result, count, density=is_density)
+            x = (0.4 * np.arange(len(y)) + 0.2).tolist()
             adj_width = 0.4 * (1 - bargap)
-            labels = [item[0] for item in query_result]
+            labels = keys.tolist()
+            y = y.tolist()
             is_categorical = True
         # case when date
         elif is_date:
@@ -725,16 +849,38 @@ class PlottingBase(PlottingBaseSQL):
             ):
                 h = vdc.numh()
             elif nbins > 0:
-                query_result = _executeSQL(
-                    query=f"""
-                        SELECT 
-                            /*+LABEL('plotting._matplotlib._compute_plot_params')*/
-                            DATEDIFF('second', MIN({vdc}), MAX({vdc}))
-                        FROM {vdc._parent}""",
-                    title="Computing the histogram interval",
-                    method="fetchrow",
-                )
-                h = float(query_result[0]) / nbins
+                bounds = [
+                    vdc._parent._get_catalog_value(vdc._alias, fun)
+                    for fun in ("min", "max")
+                ]
+                h = None
+                if "VERTICAPY_NOT_PRECOMPUTED" not in bounds:
+                    # The bounds are cached (_prefetch_1d_stats): the
+                    # interval is computed locally. Like DATEDIFF, it
+                    # counts the second boundaries between them.
+                    try:
+                        cmin, cmax = (
+                            b.replace(microsecond=0)
+                            if isinstance(b, datetime.datetime)
+                            else b
+                            for b in bounds
+                        )
+                        h = (cmax - cmin).total_seconds() / nbins
+                    except (AttributeError, TypeError):
+                        # NULL or non-temporal bounds: the database
+                        # computes the interval.
+                        pass
+                if h is None:
+                    query_result = _executeSQL(
+                        query=f"""
+                            SELECT 
+                                /*+LABEL('plotting._matplotlib._compute_plot_params')*/
+                                DATEDIFF('second', MIN({vdc}), MAX({vdc}))
+                            FROM {vdc._parent}""",
+                        title="Computing the histogram interval",
+                        method="fetchrow",
+                    )
+                    h = float(query_result[0]) / nbins
             min_date = vdc.min()
             converted_date = f"DATEDIFF('second', '{min_date}', {vdc})"
             query_result = _executeSQL(
@@ -748,35 +894,22 @@ class PlottingBase(PlottingBaseSQL):
                     GROUP BY 1 
                     ORDER BY 1""",
                 title="Computing the histogram heights",
-                method="fetchall",
-            )
-            x = [float(item[0]) for item in query_result]
-            y = (
-                [item[1] / float(count) for item in query_result]
-                if (method.lower() == "density")
-                else [item[1] for item in query_result]
-            )
-            query = "("
-            for idx, item in enumerate(query_result):
-                query_tmp = f"""
-                    (SELECT 
-                        {{}}
-                        TIMESTAMPADD('second',
-                                     {math.floor(h * idx)},
-                                     '{min_date}'::timestamp))"""
-                if idx == 0:
-                    query += query_tmp.format(
-                        "/*+LABEL('plotting._matplotlib._compute_plot_params')*/"
-                    )
-                else:
-                    query += f" UNION {query_tmp.format('')}"
-            query += ")"
-            query_result = _executeSQL(
-                query, title="Computing the datetime intervals.", method="fetchall"
+                method="fetchnumpy",
             )
+            keys, y = self._split_heights(query_result, count, density=is_density)
+            x = keys.astype(np.float64).tolist()
+            y = y.tolist()
+            # The bucket labels are an arithmetic sequence, there
+            # is no need to ask the database to generate them.
+            if isinstance(min_date, str):
+                min_date = parse(min_date)
+            elif not isinstance(min_date, datetime.datetime):
+                min_date = datetime.datetime.combine(min_date, datetime.time())
             adj_width = (1.0 - bargap) * h
-            labels = [item[0] for item in query_result]
-            labels.sort()
+            labels = [
+                min_date + datetime.timedelta(seconds=math.floor(h * idx))
+                for idx in range(len(x))
+            ]
             is_categorical = True
         # case when numerical
         else:
@@ -788,25 +921,25 @@ class PlottingBase(PlottingBaseSQL):
                 h = float(vdc.max() - vdc.min()) / nbins
             if (vdc.ctype == "int") or (h == 0):
                 h = max(1.0, h)
+            # Equal-width bins: grouping on the integer bin index
+            # is cheaper than grouping and sorting float keys.
             query_result = _executeSQL(
                 query=f"""
                     SELECT
                         /*+LABEL('plotting._matplotlib._compute_plot_params')*/
-                        FLOOR({vdc}{cast} / {h}) * {h},
+                        FLOOR({vdc}{cast} / {h})::int,
                         {aggregate} 
                     FROM {vdc._parent}
                     WHERE {vdc} IS NOT NULL
-                    GROUP BY 1
-                    ORDER BY 1""",
+                    GROUP BY 1""",
                 title="Computing the histogram heights",
-                method="fetchall",
-            )
-            y = (
-                [item[1] / float(count) for item in query_result]
-                if (method.lower() == "density")
-                else [item[1] for item in query_result]
+                method="fetchnumpy",
             )
-            x = [float(item[0]) + h / 2 for item in query_result]
+            keys, y = self._split_heights(query_result, count, density=is_density)
+            bins = keys.astype(np.int64)
+            order = np.argsort(bins, kind="stable")
+            y = y[order].tolist()
+            x = ((bins[order] + 0.5) * h).tolist()
             adj_width = (1.0 - bargap) * h
             labels = [xi - round(h / 2, 10) for xi in x]
             labels = [(li, li + h) for li in labels]
@@ -895,11 +1028,9 @@ class PlottingBase(PlottingBaseSQL):
                 categories += [category]
                 data[category] = copy.deepcopy(self.data)
         else:
-            h_, categories = [], None
+            categories = None
             if isinstance(h, NoneType) or h <= 0:
-                for idx, column in enumerate(columns_):
-                    h_ += [vdf[column].numh()]
-                h = min(h_)
+                h = min(self._numh_batch(vdf, columns_))
             data, cols = {"width": h}, []
             for idx, column in enumerate(columns_):
                 if vdf[column].isnum():
@@ -22,6 +22,18 @@ from verticapy._typing import SQLExpression
 from verticapy.core.string_sql.base import StringSQL
 
 
+def _format_decode_arg(x: SQLExpression) -> str:
+    """
+    Formats a DECODE argument. Plain numbers and strings,
+    the usual mapping keys and values, skip format_magic.
+    """
+    if type(x) in (int, float):
+        return str(x)
+    elif type(x) is str:
+        return "'" + x.replace("'", "''") + "'"
+    return str(format_magic(x))
+
+
 def case_when(*args) -> StringSQL:
     """
     Returns the conditional statement of the input
@@ -229,7 +241,7 @@ def decode(expr: SQLExpression, *args) -> StringSQL:
         "DECODE("
         + str(format_magic(expr))
         + ", "
-        + ", ".join([str(format_magic(elem)) for elem in args])
+        + ", ".join([_format_decode_arg(elem) for elem in args])
         + ")"
     )
     return StringSQL(expr, category)
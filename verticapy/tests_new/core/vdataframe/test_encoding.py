@@ -21,6 +21,11 @@ import pandas as pd
 import pytest
 from sklearn.preprocessing import LabelEncoder
 
+from verticapy._utils._sql._format import format_magic
+from verticapy.core.string_sql.base import StringSQL
+from verticapy.core.vdataframe._encoding import _bins_search_tree
+from verticapy.sql.functions.conditional import _format_decode_arg
+
 
 class TestVDFEncoding:
     """
@@ -189,6 +194,67 @@ class TestVDCEncoding:
             == titanic_pdf["sex_decode"].unique().sort()
         )
 
+    @pytest.mark.parametrize(
+        "x",
+        [1, -3, 2.5, 1e20, "male", "O'Brien", "", None, StringSQL('"sex"')],
+    )
+    def test_format_decode_arg(self, x):
+        """
+        test function - _format_decode_arg (decode fast path)
+        """
+        assert _format_decode_arg(x) == str(format_magic(x))
+
+    @pytest.mark.parametrize(
+        "edges, expected",
+        [
+            ([0, 10], "'[0;10]'"),
+            (
+                [0, 10, 20],
+                "(CASE WHEN {} <= 10 THEN '[0;10]' ELSE '[10;20]' END)",
+            ),
+            (
+                [0, 10, 20, 30],
+                "(CASE WHEN {} <= 20 THEN "
+                "(CASE WHEN {} <= 10 THEN '[0;10]' ELSE '[10;20]' END) "
+                "ELSE '[20;30]' END)",
+            ),
+        ],
+    )
+    def test_bins_search_tree(self, edges, expected):
+        """
+        test function - _bins_search_tree (discretize same_freq)
+        """
+        assert _bins_search_tree(edges, 1, len(edges) - 1) == expected
+
+    @pytest.mark.parametrize("n", [2, 3, 4, 5, 8, 9])
+    def test_bins_search_tree_edges(self, n):
+        """
+        test function - _bins_search_tree on the interval edges
+        """
+        edges = list(range(0, 10 * n, 10))
+
+        def find_bin(expr, x):
+            # evaluates the nested CASE expression for x
+            while expr.startswith("(CASE WHEN {} <= "):
+                edge, rest = expr[len("(CASE WHEN {} <= ") :].split(" THEN ", 1)
+                depth, i = 0, 0
+                while depth or not rest[i:].startswith(" ELSE "):
+                    depth += {"(": 1, ")": -1}.get(rest[i], 0)
+                    i += 1
+                left, right = rest[:i], rest[i + len(" ELSE ") : -len(" END)")]
+                expr = left if x <= float(edge) else right
+            return expr
+
+        expr = _bins_search_tree(edges, 1, n - 1)
+        for x in [edges[0] + d for d in (-1, 0)] + [
+            e + d for e in edges[1:] for d in (-0.5, 0, 0.5)
+        ]:
+            # a value equal to an edge belongs to the first interval
+            # containing it; the values out of range go to the first
+            # or the last interval
+            j = next((i for i in range(1, n) if x <= edges[i]), n - 1)
+            assert find_bin(expr, x) == f"'[{edges[j - 1]};{edges[j]}]'"
+
     @pytest.mark.parametrize(
         "column, method, h, nbins, k, new_category, rf_model_params, response, expected",
         [
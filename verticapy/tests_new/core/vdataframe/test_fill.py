@@ -160,17 +160,19 @@ class TestFill:
         assert vpy_res == pytest.approx(py_res)
 
     @pytest.mark.parametrize(
-        "column, method, threshold, use_threshold, alpha",
+        "column, method, threshold, use_threshold, alpha, approx",
         [
-            ("Price", "null", 0.4, True, 0.05),
-            ("Price", "winsorize", 0.4, True, 0.05),
-            ("Price", "winsorize", None, False, 0.2),
-            ("Price", "mean", 0.4, True, 0.05),
-            ("Price", "mean", 0.4, True, 0.05),
+            ("Price", "null", 0.4, True, 0.05, False),
+            ("Price", "winsorize", 0.4, True, 0.05, False),
+            ("Price", "winsorize", None, False, 0.2, False),
+            ("Price", "winsorize", None, False, 0.2, True),
+            ("Price", "null", None, False, 0.2, True),
+            ("Price", "mean", 0.4, True, 0.05, False),
+            ("Price", "mean", 0.4, True, 0.05, False),
         ],
     )
     def test_fill_outliers(
-        self, market_vd, column, method, threshold, use_threshold, alpha
+        self, market_vd, column, method, threshold, use_threshold, alpha, approx
     ):
         """
         test function - fill_outliers
@@ -204,6 +206,7 @@ class TestFill:
                 threshold=threshold,
                 use_threshold=use_threshold,
                 alpha=alpha,
+                approx=approx,
             )[column]
             .mean()
         )
@@ -219,4 +222,5 @@ class TestFill:
             f"method name: {'method'} \nVerticaPy Result: {vpy_res} \nPython Result :{py_res}\n"
         )
 
-        assert vpy_res == pytest.approx(py_res)
+        # approximate quantiles are only close to the exact ones
+        assert vpy_res == pytest.approx(py_res, rel=1e-02 if approx else 1e-06)
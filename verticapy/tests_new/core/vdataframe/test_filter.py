@@ -398,14 +398,15 @@ class TestFilter:
         assert vpy_res[5] == py_res.iloc[5].tolist() and len(vpy_res) == len(py_res)
 
     @pytest.mark.parametrize(
-        "column, threshold, use_threshold, alpha",
+        "column, threshold, use_threshold, alpha, approx",
         [
-            ("age", 3.0, True, 0.05),
-            ("age", 3.0, False, 0.07),
+            ("age", 3.0, True, 0.05, True),
+            ("age", 3.0, False, 0.07, True),
+            ("age", 3.0, False, 0.07, False),
         ],
     )
     def test_drop_outliers(
-        self, titanic_vd_fun, column, threshold, use_threshold, alpha
+        self, titanic_vd_fun, column, threshold, use_threshold, alpha, approx
     ):
         """
         test function - drop_outliers
@@ -414,7 +415,10 @@ class TestFilter:
         titanic_pdf[column] = titanic_pdf[column].astype(float)
 
         vpy_res = titanic_vd_fun[column].drop_outliers(
-            threshold=threshold, use_threshold=use_threshold, alpha=alpha
+            threshold=threshold,
+            use_threshold=use_threshold,
+            alpha=alpha,
+            approx=approx,
         )
 
         if use_threshold:
@@ -14,13 +14,16 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
+from decimal import Decimal
 from itertools import chain
+import math
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 
 import verticapy as vp
+from verticapy.plotting.base import PlottingBase, _optimal_bar_width
 
 
 class TestPlotting:
@@ -185,6 +188,49 @@ class TestPlotting:
 
         assert vpy_res == pytest.approx(py_res, rel=8e-03)
 
+    @pytest.mark.parametrize("count", [1, 2, 3, 7, 8, 9, 1000, 2**20])
+    def test_optimal_bar_width(self, count):
+        """
+        test function - _optimal_bar_width (shared by numh
+        and the batched plotting path)
+        """
+        sturges, fd = _optimal_bar_width(count, 0, 25, 75, 100)
+
+        assert sturges == pytest.approx(100 / math.floor(math.log2(count) + 2))
+        assert fd == pytest.approx(2.0 * 50 / count ** (1.0 / 3.0))
+
+    def test_optimal_bar_width_empty(self):
+        """
+        test function - _optimal_bar_width on an empty column
+        """
+        assert _optimal_bar_width(0, None, None, None, None) == (1e-99, 1e-99)
+
+    def test_optimal_bar_width_constant(self):
+        """
+        test function - _optimal_bar_width on a constant column
+        """
+        assert _optimal_bar_width(10, 5, 5, 5, 5) == (1e-99, 1e-99)
+
+    @pytest.mark.parametrize(
+        "query_result, density, expected_x, expected_y",
+        [
+            ([], False, [], []),
+            ([("a", 1), ("b", 3)], False, ["a", "b"], [1.0, 3.0]),
+            ([["a", 2], ["b", None]], False, ["a", "b"], [2.0, 0.0]),
+            ([("a", 1), ("b", None), ("c", 3)], True, ["a", "b", "c"], [0.25, 0, 0.75]),
+            ([(None, 4), (1.5, Decimal("2.5"))], False, [None, 1.5], [4.0, 2.5]),
+        ],
+    )
+    def test_split_heights(self, query_result, density, expected_x, expected_y):
+        """
+        test function - PlottingBase._split_heights
+        """
+        x, y = PlottingBase._split_heights(query_result, count=4, density=density)
+
+        assert x.tolist() == expected_x
+        assert y.dtype == np.float64
+        assert y.tolist() == pytest.approx(expected_y)
+
     def test_spider(self):
         """
         test function - spider
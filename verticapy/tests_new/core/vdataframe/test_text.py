@@ -195,6 +195,102 @@ class TestText:
 
         assert vpy_res == py_res
 
+    @pytest.mark.parametrize(
+        "method, kwargs, expected",
+        [
+            ("str_contains", {"pat": "mrs"}, "REGEXP_COUNT({}, 'mrs') > 0"),
+            (
+                "str_contains",
+                {"pat": "mrs", "flags": "i"},
+                "REGEXP_COUNT({}, 'mrs', 1, 'i') > 0",
+            ),
+            ("str_count", {"pat": "a"}, "REGEXP_COUNT({}, 'a')"),
+            ("str_count", {"pat": "a", "flags": "i"}, "REGEXP_COUNT({}, 'a', 1, 'i')"),
+            ("str_extract", {"pat": "mr?s"}, "REGEXP_SUBSTR({}, 'mr?s')"),
+            (
+                "str_extract",
+                {"pat": "mr?s", "flags": "in"},
+                "REGEXP_SUBSTR({}, 'mr?s', 1, 1, 'in')",
+            ),
+            (
+                "str_replace",
+                {"to_replace": "mrs", "value": "X", "flags": "i"},
+                "REGEXP_REPLACE({}, 'mrs', 'X', 1, 0, 'i')",
+            ),
+        ],
+    )
+    def test_str_flags(self, titanic_vd_fun, method, kwargs, expected):
+        """
+        test function - flags of the str_* methods for vColumns
+        """
+        getattr(titanic_vd_fun["name"], method)(**kwargs)
+
+        assert titanic_vd_fun["name"]._transf[-1][0] == expected
+
+    @pytest.mark.parametrize(
+        "to_replace, value, expected",
+        [
+            # Plain literal: REPLACE.
+            ("Mrs", "Mr", "REPLACE({}, 'Mrs', 'Mr')"),
+            ("O'Brien", "X", "REPLACE({}, 'O''Brien', 'X')"),
+            # Fallbacks to REGEXP_REPLACE.
+            ("", "X", "REGEXP_REPLACE({}, '', 'X')"),
+            ("Mrs", r"\1", r"REGEXP_REPLACE({}, 'Mrs', '\1')"),
+            ("Mrs.", "Mr", "REGEXP_REPLACE({}, 'Mrs.', 'Mr')"),
+            ("(Mrs)", "Mr", "REGEXP_REPLACE({}, '(Mrs)', 'Mr')"),
+            ("M*", "Mr", "REGEXP_REPLACE({}, 'M*', 'Mr')"),
+            ("a|b", "c", "REGEXP_REPLACE({}, 'a|b', 'c')"),
+        ],
+    )
+    def test_str_replace_sql(self, titanic_vd_fun, to_replace, value, expected):
+        """
+        test function - str_replace generated SQL for vColumns
+        """
+        titanic_vd_fun["name"].str_replace(to_replace=to_replace, value=value)
+
+        assert titanic_vd_fun["name"]._transf[-1][0] == expected
+
+    @pytest.mark.parametrize("column, to_replace, value", [("name", "Mrs", "Mr")])
+    def test_str_replace_literal(self, titanic_vd_fun, column, to_replace, value):
+        """
+        test function - str_replace for vColumns (literal path)
+        """
+        titanic_pdf = titanic_vd_fun.to_pandas()
+
+        _vpy_res = (
+            titanic_vd_fun[column]
+            .str_replace(to_replace=to_replace, value=value)[column][:5]
+            .to_list()
+        )
+        vpy_res = list(chain(*_vpy_res))
+
+        py_res = (
+            titanic_pdf[column]
+            .str.replace(to_replace, value, regex=False)
+            .head(5)
+            .to_list()
+        )
+
+        assert vpy_res == py_res
+
+    @pytest.mark.parametrize("column, pat", [("name", "MRS")])
+    def test_str_contains_flags(self, titanic_vd_fun, column, pat):
+        """
+        test function - str_contains with flags for vColumns
+        """
+        titanic_pdf = titanic_vd_fun.to_pandas()
+
+        _vpy_res = (
+            titanic_vd_fun[column]
+            .str_contains(pat=pat, flags="i")[column][:5]
+            .to_list()
+        )
+        vpy_res = list(chain(*_vpy_res))
+
+        py_res = titanic_pdf[column].str.contains(pat=pat, case=False).head(5).to_list()
+
+        assert vpy_res == py_res
+
     @pytest.mark.parametrize("column, start, end", [("name", 0, 3), ("name", 0, 4)])
     # step parameter name does not do its intended work. May needs to change
     def test_str_slice(self, titanic_vd_fun, column, start, end):
@@ -18,6 +18,7 @@ from itertools import chain
 import os
 
 import pytest
+from vertica_python.errors import QueryError
 
 import verticapy as vp
 from verticapy.errors import ConversionError
@@ -29,12 +30,13 @@ class TestVDFTyping:
     test class for Typing functions test for vDataFrame class
     """
 
-    def test_astype(self, titanic_vd_fun):
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_astype(self, titanic_vd_fun, validate):
         """
         test function - astype for vDataframe
         """
         # Testing vDataFrame.astype
-        titanic_vd_fun.astype({"fare": "int", "cabin": "varchar(1)"})
+        titanic_vd_fun.astype({"fare": "int", "cabin": "varchar(1)"}, validate=validate)
 
         assert titanic_vd_fun["fare"].dtype() == "int"
         assert titanic_vd_fun["cabin"].dtype() == "varchar(1)"
@@ -135,6 +137,19 @@ class TestVDCTyping:
         titanic_vd_fun["age"].astype("float")
         assert titanic_vd_fun["age"].dtype() == "float"
 
+    def test_astype_no_validation(self, titanic_vd_fun):
+        """
+        test function - astype for vColumn with validate=False
+        """
+        # the invalid conversion is not checked by astype ...
+        titanic_vd_fun["sex"].astype("int", validate=False)
+        assert titanic_vd_fun["sex"].dtype() == "int"
+
+        # ... but by the next query using the vColumn
+        with pytest.raises(QueryError) as exception_info:
+            titanic_vd_fun[["sex"]].to_list()
+        assert exception_info.match('Could not convert "female"')
+
     def test_astype_str_to_vmap(self):
         """
         test function - astype
@@ -0,0 +1,83 @@
+"""
+Copyright  (c)  2018-2024 Open Text  or  one  of its
+affiliates.  Licensed  under  the   Apache  License,
+Version 2.0 (the  "License"); You  may  not use this
+file except in compliance with the License.
+
+You may obtain a copy of the License at:
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless  required  by applicable  law or  agreed to in
+writing, software  distributed  under the  License is
+distributed on an  "AS IS" BASIS,  WITHOUT WARRANTIES
+OR CONDITIONS OF ANY KIND, either express or implied.
+See the  License for the specific  language governing
+permissions and limitations under the License.
+"""
+import pytest
+
+from verticapy._utils._sql._merge import (
+    _build_trie,
+    _match_trie,
+    erase_prefix_in_name,
+    erase_suffix_in_name,
+)
+
+
+class TestTrie:
+    """
+    test class for the prefix / suffix trie
+    """
+
+    @pytest.mark.parametrize(
+        "words, name, expected",
+        [
+            # the first matching word in list order wins ...
+            (("ab", "abc"), "abcd", 2),
+            # ... even when it is not the longest one
+            (("abc", "ab"), "abcd", 3),
+            (("x", "abc", "ab"), "abcd", 3),
+            # partial paths are not matches
+            (("abcde",), "abcd", -1),
+            (("b", "c"), "abcd", -1),
+            (("a", "a"), "abcd", 1),
+            (("",), "abcd", 0),
+        ],
+    )
+    def test_match_trie(self, words, name, expected):
+        """
+        test function - _build_trie / _match_trie
+        """
+        assert _match_trie(name, _build_trie(words)) == expected
+
+    @pytest.mark.parametrize(
+        "name, prefix, expected",
+        [
+            ("col_age", ["col_", "col"], "age"),
+            ("col_age", ["col", "col_"], "_age"),
+            ("col_age", ["x_", "y_"], "col_age"),
+            ("col_age", "col_", "age"),
+            ("col_age", None, "col_age"),
+        ],
+    )
+    def test_erase_prefix_in_name(self, name, prefix, expected):
+        """
+        test function - erase_prefix_in_name
+        """
+        assert erase_prefix_in_name(name, prefix) == expected
+
+    @pytest.mark.parametrize(
+        "name, suffix, expected",
+        [
+            ("age_avg", ["_avg", "avg"], "age"),
+            ("age_avg", ["avg", "_avg"], "age_"),
+            ("age_avg", ["", "_avg"], "age"),
+            ("age_avg", ["_std", "_min"], "age_avg"),
+            ("age_avg", None, "age_avg"),
+        ],
+    )
+    def test_erase_suffix_in_name(self, name, suffix, expected):
+        """
+        test function - erase_suffix_in_name
+        """
+        assert erase_suffix_in_name(name, suffix) == expected